@@ -18,12 +18,14 @@ from .model import (
 )
 from .compiler import (
     compile_to_xml,
+    compile_to_xml_stream,
     compile,
     build_run_config,
     compile_and_write,
     CompiledModel,
     LayerProbe,
     ProbeMetadata,
+    quantize_weights,
     write_input_data,
 )
 from .runner import NemoSimRunner, RunResult
@@ -36,12 +38,14 @@ __all__ = [
     "NeuronOverrideRange",
     "NeuronOverride",
     "compile_to_xml",
+    "compile_to_xml_stream",
     "compile",
     "build_run_config",
     "compile_and_write",
     "CompiledModel",
     "LayerProbe",
     "ProbeMetadata",
+    "quantize_weights",
     "write_input_data",
     "NemoSimRunner",
     "RunResult",
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from collections.abc import Iterable as IterableABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union, cast
-import xml.etree.ElementTree as ET
+import collections
+import hashlib
+import io
+import itertools
+import mmap
+import operator
+import os
 import json
+import pickle
+
+try:  # numpy is optional; used only as a fast path for large weight matrices
+    import numpy as _np
+except ModuleNotFoundError:  # pragma: no cover - exercised on numpy-less installs
+    _np = None  # type: ignore[assignment]
+
+try:  # orjson is optional; used only as a fast path for JSON emission
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised on orjson-less installs
+    _orjson = None  # type: ignore[assignment]
+
+try:  # fastnumbers is optional; used only as a fast path for float parsing
+    from fastnumbers import fast_float as _fast_float
+except ModuleNotFoundError:  # pragma: no cover - exercised on fastnumbers-less installs
+    _fast_float = float  # type: ignore[assignment]
 
 from .model import (
     BIUNetworkDefaults,
     Layer,
-    materialize_precedence,
 )
 
 # Hard-coded supervisor defaults - no longer user-configurable
@@ -27,11 +50,54 @@ InputSample = Union[Number, Iterable[Number], str, bytes]
 InputData = Iterable[InputSample]
 
 
-def _append_text(parent: ET.Element, tag: str, text: str) -> ET.Element:
-    """Create a child element under `parent` with stringified text content."""
-    el = ET.SubElement(parent, tag)
-    el.text = str(text)
-    return el
+def _xml_emit(buf: list[str], tag: str, value: Any) -> None:
+    """Append `<tag>value</tag>` to the output buffer.
+
+    Values here are numbers or whitelisted enum strings, so no escaping is
+    needed; emitting fragments directly into a string buffer avoids building
+    a Python object per XML element.
+    """
+    buf.append(f"<{tag}>{value}</{tag}>")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_weight(v: float) -> str:
+    """Format a single weight cell, trimming trailing zeros from floats.
+
+    Cells are normalized to float by Synapses.validate(), so no per-cell type
+    test is needed. Cached because real synapse matrices are sparse/quantized
+    with a handful of distinct values, so repeated cells hit the cache
+    instead of re-stringifying.
+    """
+    s = str(v)
+    return s.rstrip("0").rstrip(".") if "." in s else s
+
+
+# Single C-level fetch of the three override fields, used in the hot loops
+# instead of three attribute lookups per object.
+_get_vrr = operator.attrgetter("VTh", "RLeak", "refractory")
+
+
+def _coalesce_neuron_runs(neurons: Sequence[Any]) -> Iterator[tuple[int, int, Any, Any, Any]]:
+    """Yield `(start, end, VTh, RLeak, refractory)` runs of neuron overrides.
+
+    Neurons are grouped by identical override values; contiguous index runs are
+    collapsed so large blocks of identical per-neuron overrides can be emitted
+    as one `<NeuronRange>` instead of N `<Neuron>` elements.
+    """
+    ordered = sorted(neurons, key=operator.attrgetter("index"))
+    for (vth, rl, rf), group in itertools.groupby(ordered, key=_get_vrr):
+        run_start: Optional[int] = None
+        prev = -2
+        for n in group:
+            if run_start is None:
+                run_start = n.index
+            elif n.index != prev + 1:
+                yield run_start, prev, vth, rl, rf
+                run_start = n.index
+            prev = n.index
+        if run_start is not None:
+            yield run_start, prev, vth, rl, rf
 
 
 def compile_to_xml(
@@ -55,104 +121,284 @@ def compile_to_xml(
     tuple[str, Optional[str]]
         `(biu_xml, supervisor_xml)` where `supervisor_xml` is None when not requested.
     """
+    biu_xml = "".join(_iter_network_xml(defaults, layers))
+
+    sup_xml: Optional[str] = None
+    if include_supervisor:
+        sup_xml = _default_supervisor_xml()
+
+    return biu_xml, sup_xml
+
+
+def compile_to_xml_stream(
+    defaults: BIUNetworkDefaults,
+    layers: list[Layer],
+    writer: io.TextIOBase,
+) -> None:
+    """Stream the BIU network XML into `writer` chunk by chunk.
+
+    Peak memory stays bounded by the largest single layer instead of the full
+    document, which matters for networks with dense weight matrices.
+    """
+    for chunk in _iter_network_xml(defaults, layers):
+        writer.write(chunk)
+
+
+def _iter_network_xml(defaults: BIUNetworkDefaults, layers: list[Layer]) -> Iterator[str]:
+    """Yield the BIU network XML as chunks (header, one per layer, footer)."""
     # Validate inputs early
     defaults.validate()
     for lyr in layers:
         lyr.validate()
 
-    # Root NetworkConfig for BIU
-    root = ET.Element("NetworkConfig", {"type": "BIUNetwork"})
-    biu = ET.SubElement(root, "BIUNetwork")
-
-    # Global defaults under <BIUNetwork>
-    if defaults.VTh is not None:
-        _append_text(biu, "VTh", defaults.VTh)
-    if defaults.RLeak is not None:
-        _append_text(biu, "RLeak", defaults.RLeak)
-    if defaults.refractory is not None:
-        _append_text(biu, "refractory", defaults.refractory)
-    if defaults.VDD is not None:
-        _append_text(biu, "VDD", defaults.VDD)
-    if defaults.Cn is not None:
-        _append_text(biu, "Cn", defaults.Cn)
-    if defaults.Cu is not None:
-        _append_text(biu, "Cu", defaults.Cu)
-    if defaults.fclk is not None:
-        _append_text(biu, "fclk", defaults.fclk)
-    if defaults.DSClockMHz is not None:
-        if defaults.DSClockMHz <= 0:
+    # Emit XML fragments directly into a string buffer; building and then
+    # serializing an ElementTree costs a Python object per element. The fixed
+    # skeleton pieces are precomputed module-level templates.
+    buf: list[str] = [_BIU_HEADER]
+    _emit_defaults(buf, defaults)
+    buf.append(_ARCH_OPEN)
+    yield "".join(buf)
+
+    if len(layers) >= _PARALLEL_LAYER_THRESHOLD:
+        # Layer fragments are independent; fan the formatter loops out over a
+        # thread pool (numpy releases the GIL inside the C formatter). Only a
+        # bounded window of futures is in flight at once, so streaming
+        # consumers hold O(window) fragments rather than the whole document —
+        # eager ex.map would materialize every fragment regardless of
+        # consumer pace.
+        max_workers = os.cpu_count() or 1
+        window = max_workers * 2
+        layer_iter = iter(layers)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            pending = collections.deque(
+                ex.submit(_emit_layer_to_str, lyr)
+                for lyr in itertools.islice(layer_iter, window)
+            )
+            while pending:
+                fragment = pending.popleft().result()
+                nxt = next(layer_iter, None)
+                if nxt is not None:
+                    pending.append(ex.submit(_emit_layer_to_str, nxt))
+                yield fragment
+    else:
+        for lyr in layers:
+            yield _emit_layer_to_str(lyr)
+
+    yield _FOOTER
+
+
+# Minimum layer count before per-layer emission is worth a thread pool; small
+# stacks are mostly GIL-bound f-string work where a pool only adds overhead.
+_PARALLEL_LAYER_THRESHOLD = 32
+
+# Bytes per tokenization window when iterating signal files via mmap.
+_ITER_WINDOW = 1 << 20
+
+
+# Fragment cache for iterative compile cycles: when a user tweaks one layer
+# and recompiles, every untouched layer is an O(1) hash lookup.
+_LAYER_FRAGMENT_CACHE: dict[bytes, str] = {}
+_LAYER_FRAGMENT_CACHE_MAX = 128
+
+
+def _layer_fragment_key(lyr: Layer) -> bytes:
+    """Digest of everything that feeds a layer's XML fragment."""
+    syn = lyr.synapses
+    h = hashlib.blake2b(digest_size=16)
+    h.update(
+        pickle.dumps(
+            (
+                lyr.size,
+                syn.rows,
+                syn.cols,
+                tuple((r.start, r.end, *_get_vrr(r)) for r in lyr.ranges),
+                tuple((n.index, *_get_vrr(n)) for n in lyr.neurons),
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    )
+    if _np is not None and isinstance(syn.weights, _np.ndarray):
+        # dtype and shape disambiguate arrays whose raw bytes coincide
+        # (e.g. int64 vs float64 views of the same buffer).
+        h.update(f"{syn.weights.dtype.str}{syn.weights.shape}".encode())
+        h.update(syn.weights.tobytes())
+    else:
+        h.update(pickle.dumps(syn.weights, protocol=pickle.HIGHEST_PROTOCOL))
+    return h.digest()
+
+
+def _emit_layer_to_str(lyr: Layer) -> str:
+    """Emit one `<Layer>` element as a standalone string fragment."""
+    key = _layer_fragment_key(lyr)
+    fragment = _LAYER_FRAGMENT_CACHE.get(key)
+    if fragment is None:
+        buf: list[str] = []
+        _emit_layer(buf, lyr)
+        fragment = "".join(buf)
+        if len(_LAYER_FRAGMENT_CACHE) >= _LAYER_FRAGMENT_CACHE_MAX:
+            _LAYER_FRAGMENT_CACHE.pop(next(iter(_LAYER_FRAGMENT_CACHE)))
+        _LAYER_FRAGMENT_CACHE[key] = fragment
+    return fragment
+
+
+# Fixed XML skeleton shared by every compile call.
+_BIU_HEADER = "<?xml version='1.0' encoding='utf-8'?>\n" '<NetworkConfig type="BIUNetwork"><BIUNetwork>'
+_ARCH_OPEN = "</BIUNetwork><Architecture>"
+_FOOTER = "</Architecture></NetworkConfig>"
+
+
+def _emit_defaults(buf: list[str], defaults: BIUNetworkDefaults) -> None:
+    """Emit the global defaults that sit under `<BIUNetwork>`."""
+    buf.append(
+        _defaults_fragment(
+            defaults.VTh,
+            defaults.RLeak,
+            defaults.refractory,
+            defaults.VDD,
+            defaults.Cn,
+            defaults.Cu,
+            defaults.fclk,
+            defaults.DSClockMHz,
+            defaults.DSBitWidth,
+            defaults.DSMode,
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _defaults_fragment(
+    vth: Optional[float],
+    rleak: Optional[float],
+    refractory: Optional[int],
+    vdd: Optional[float],
+    cn: Optional[float],
+    cu: Optional[float],
+    fclk: Optional[float],
+    ds_clock_mhz: Optional[float],
+    ds_bitwidth: Optional[int],
+    ds_mode: Optional[str],
+) -> str:
+    """Build the defaults fragment once per distinct field combination.
+
+    Tuning loops recompile with identical defaults, so the eleven
+    branch-and-format steps collapse to one cache lookup on warm calls.
+    """
+    buf: list[str] = []
+    if vth is not None:
+        _xml_emit(buf, "VTh", vth)
+    if rleak is not None:
+        _xml_emit(buf, "RLeak", rleak)
+    if refractory is not None:
+        _xml_emit(buf, "refractory", refractory)
+    if vdd is not None:
+        _xml_emit(buf, "VDD", vdd)
+    if cn is not None:
+        _xml_emit(buf, "Cn", cn)
+    if cu is not None:
+        _xml_emit(buf, "Cu", cu)
+    if fclk is not None:
+        _xml_emit(buf, "fclk", fclk)
+    if ds_clock_mhz is not None:
+        if ds_clock_mhz <= 0:
             raise ValueError("DSClockMHz must be positive")
-        _append_text(biu, "DSClockMHz", defaults.DSClockMHz)
-    if defaults.DSBitWidth is not None:
-        if defaults.DSBitWidth not in {4, 8}:
+        _xml_emit(buf, "DSClockMHz", ds_clock_mhz)
+    if ds_bitwidth is not None:
+        if ds_bitwidth not in {4, 8}:
             raise ValueError("DSBitWidth must be 4 or 8")
-        _append_text(biu, "DSBitWidth", defaults.DSBitWidth)
+        _xml_emit(buf, "DSBitWidth", ds_bitwidth)
     # DSMode defaulting: missing or empty -> ThresholdMode (informational)
-    if defaults.DSMode is None or defaults.DSMode == "":
-        _append_text(biu, "DSMode", "ThresholdMode")
+    if ds_mode is None or ds_mode == "":
+        _xml_emit(buf, "DSMode", "ThresholdMode")
     else:
-        if defaults.DSMode not in {"ThresholdMode", "FrequencyMode"}:
+        if ds_mode not in {"ThresholdMode", "FrequencyMode"}:
             raise ValueError("DSMode must be 'ThresholdMode' or 'FrequencyMode'")
-        _append_text(biu, "DSMode", defaults.DSMode)
-
-    arch = ET.SubElement(root, "Architecture")
-
-    for lyr in layers:
-        l_el = ET.SubElement(arch, "Layer", {"size": str(lyr.size)})
-        # Synapses
-        syn = ET.SubElement(l_el, "synapses", {"rows": str(lyr.synapses.rows), "cols": str(lyr.synapses.cols)})
-        w = ET.SubElement(syn, "weights")
-        if len(lyr.synapses.weights) == 0:
-            raise ValueError("Missing required <weights> rows under <synapses>")
+        _xml_emit(buf, "DSMode", ds_mode)
+    return "".join(buf)
+
+
+def _emit_layer(buf: list[str], lyr: Layer) -> None:
+    """Emit one `<Layer>` element (synapses plus per-neuron overrides)."""
+    buf.append(f'<Layer size="{lyr.size}">')
+    # Synapses
+    buf.append(f'<synapses rows="{lyr.synapses.rows}" cols="{lyr.synapses.cols}"><weights>')
+    if len(lyr.synapses.weights) == 0:
+        raise ValueError("Missing required <weights> rows under <synapses>")
+    if _np is not None and isinstance(lyr.synapses.weights, _np.ndarray):
+        # Format the whole matrix in C via numpy instead of str() per
+        # scalar. Only caller-passed arrays take this path — list weights
+        # keep the repr-exact per-cell formatting below, so the emitted
+        # XML never depends on whether numpy happens to be installed.
+        weights = lyr.synapses.weights
+        sbuf = io.StringIO()
+        # %.17g round-trips every float64 exactly; %g would quietly round
+        # anything past 6 significant digits in the emitted XML.
+        _np.savetxt(sbuf, weights, fmt="%.17g", delimiter=" ")
+        for row_str in sbuf.getvalue().splitlines():
+            _xml_emit(buf, "row", row_str)
+    else:
         for row in lyr.synapses.weights:
-            row_str = " ".join(str(v).rstrip("0").rstrip(".") if isinstance(v, float) else str(v) for v in row)
-            _append_text(w, "row", row_str)
-
-        # Per-neuron overrides using precedence
-        vectors = materialize_precedence(lyr.size, defaults, lyr.ranges, lyr.neurons)
-
-        # Emit ranges
-        for r in lyr.ranges:
-            r_el = ET.SubElement(l_el, "NeuronRange", {"start": str(r.start), "end": str(r.end)})
-            if r.VTh is not None:
-                _append_text(r_el, "VTh", r.VTh)
-            if r.RLeak is not None:
-                _append_text(r_el, "RLeak", r.RLeak)
-            if r.refractory is not None:
-                _append_text(r_el, "refractory", r.refractory)
-
-        # Emit neuron-specific overrides last (most specific)
-        for n in lyr.neurons:
-            n_el = ET.SubElement(l_el, "Neuron", {"index": str(n.index)})
-            if n.VTh is not None:
-                _append_text(n_el, "VTh", n.VTh)
-            if n.RLeak is not None:
-                _append_text(n_el, "RLeak", n.RLeak)
-            if n.refractory is not None:
-                _append_text(n_el, "refractory", n.refractory)
-
-    # Serialize BIU network XML
-    biu_xml = ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8")
+            _xml_emit(buf, "row", " ".join(map(_fmt_weight, row)))
+    buf.append("</weights></synapses>")
+
+    # Emit ranges
+    for r in lyr.ranges:
+        buf.append(f'<NeuronRange start="{r.start}" end="{r.end}">')
+        vth, rl, rf = _get_vrr(r)
+        if vth is not None:
+            _xml_emit(buf, "VTh", vth)
+        if rl is not None:
+            _xml_emit(buf, "RLeak", rl)
+        if rf is not None:
+            _xml_emit(buf, "refractory", rf)
+        buf.append("</NeuronRange>")
+
+    # Emit neuron-specific overrides last (most specific). Contiguous runs
+    # of identical overrides are collapsed into a single <NeuronRange> to
+    # keep the XML small for the common "many identical neurons" case.
+    for start, end, vth, rl, rf in _coalesce_neuron_runs(lyr.neurons):
+        if end > start:
+            buf.append(f'<NeuronRange start="{start}" end="{end}">')
+            close = "</NeuronRange>"
+        else:
+            buf.append(f'<Neuron index="{start}">')
+            close = "</Neuron>"
+        if vth is not None:
+            _xml_emit(buf, "VTh", vth)
+        if rl is not None:
+            _xml_emit(buf, "RLeak", rl)
+        if rf is not None:
+            _xml_emit(buf, "refractory", rf)
+        buf.append(close)
+
+    buf.append("</Layer>")
+
+
+# Only analog-ish defaults are typical in supervisor examples
+_SUPERVISOR_FIELDS = ("fclk", "RLeak", "VDD", "Cn", "Cu")
+
+
+def _emit_supervisor_xml(sdef: BIUNetworkDefaults) -> str:
+    """Emit the tiny supervisor XML from a string template.
+
+    The supervisor file is a fixed five-field subset of the defaults, so it is
+    assembled directly instead of building a throwaway ElementTree.
+    """
+    parts = [
+        "<?xml version='1.0' encoding='utf-8'?>\n",
+        '<NetworkConfig type="BIUNetwork"><BIUNetwork>',
+    ]
+    for tag in _SUPERVISOR_FIELDS:
+        value = getattr(sdef, tag)
+        if value is not None:
+            parts.append(f"<{tag}>{value}</{tag}>")
+    parts.append("</BIUNetwork></NetworkConfig>")
+    return "".join(parts)
 
-    sup_xml: Optional[str] = None
-    if include_supervisor:
-        sup_root = ET.Element("NetworkConfig", {"type": "BIUNetwork"})
-        sup_biu = ET.SubElement(sup_root, "BIUNetwork")
-        sdef = _DEFAULT_SUPERVISOR_DEFAULTS
-        # Only analog-ish defaults are typical in supervisor examples
-        if sdef.fclk is not None:
-            _append_text(sup_biu, "fclk", sdef.fclk)
-        if sdef.RLeak is not None:
-            _append_text(sup_biu, "RLeak", sdef.RLeak)
-        if sdef.VDD is not None:
-            _append_text(sup_biu, "VDD", sdef.VDD)
-        if sdef.Cn is not None:
-            _append_text(sup_biu, "Cn", sdef.Cn)
-        if sdef.Cu is not None:
-            _append_text(sup_biu, "Cu", sdef.Cu)
-        sup_xml = ET.tostring(sup_root, encoding="utf-8", xml_declaration=True).decode("utf-8")
 
-    return biu_xml, sup_xml
+@lru_cache(maxsize=1)
+def _default_supervisor_xml() -> str:
+    """Supervisor defaults are hard-coded, so the emitted string never varies."""
+    return _emit_supervisor_xml(_DEFAULT_SUPERVISOR_DEFAULTS)
 
 
 @dataclass(slots=True)
@@ -226,6 +472,7 @@ def compile(
     out_dir: Optional[Path] = None,
     data_input_file: Optional[Path] = None,
     input_data: Optional[InputData] = None,
+    output_directory: Optional[Path] = None,
     synapses_energy_table_path: Optional[Path] = None,
     neuron_energy_table_path: Optional[Path] = None,
 ) -> Union[tuple[str, Optional[str]], "CompiledModel"]:
@@ -236,6 +483,8 @@ def compile(
     - If `out_dir` is None: returns `(biu_xml, supervisor_xml)` strings.
     - If `out_dir` is provided: writes `biu.xml`, optional `supervisor.xml`, and
       `config.json`, then returns a `CompiledModel` with the config path.
+    - `output_directory` overrides where the simulator writes its outputs
+      (defaults to `out_dir / "output"`).
     """
     if input_data is not None and out_dir is None:
         raise ValueError("input_data requires out_dir to be provided")
@@ -245,36 +494,60 @@ def compile(
     # Validate probe uniqueness and persist metadata
     probe_to_layer, probe_metadata = _collect_probe_metadata(layers)
 
-    biu_xml, sup_xml = compile_to_xml(
-        defaults=defaults,
-        layers=layers,
-        include_supervisor=include_supervisor,
-    )
     if out_dir is None:
-        return biu_xml, sup_xml
-
-    # Write artifacts and return config path
-    out_dir.mkdir(parents=True, exist_ok=True)
-    biu_xml_path = out_dir / "biu.xml"
-    write_text(biu_xml_path, biu_xml)
-    sup_xml_path = None
-    if sup_xml is not None:
-        sup_xml_path = out_dir / "supervisor.xml"
-        write_text(sup_xml_path, sup_xml)
+        return compile_to_xml(
+            defaults=defaults,
+            layers=layers,
+            include_supervisor=include_supervisor,
+        )
 
-    input_path: Optional[Path] = None
+    input_path: Optional[Path]
     if input_data is not None:
         input_path = out_dir / "input.txt"
-        write_input_data(input_path, input_data)
     elif data_input_file is not None:
         input_path = Path(data_input_file)
-    if input_path is None:
+    else:
         raise ValueError(
             "data_input_file must be provided when out_dir is specified (or supply input_data)"
         )
 
+    # Write artifacts and return config path. Create the output tree once up
+    # front so the individual writes can skip their own mkdir calls.
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if output_directory is None:
+        output_directory = out_dir / "output"
+        output_directory.mkdir(exist_ok=True)
+    else:
+        output_directory.mkdir(parents=True, exist_ok=True)
+    biu_xml_path = out_dir / "biu.xml"
+    sup_xml_path = out_dir / "supervisor.xml" if include_supervisor else None
+
+    def _write_biu() -> None:
+        # Stream biu.xml straight to disk so peak memory stays bounded by
+        # the largest layer rather than the full document.
+        with biu_xml_path.open("w", encoding="utf-8") as fh:
+            compile_to_xml_stream(defaults, layers, fh)
+
+    # The three artifact bodies are independent, so overlap their disk I/O;
+    # config.json only references the paths and is written below.
+    writes = [_write_biu]
+    if sup_xml_path is not None:
+        writes.append(
+            lambda: write_text(
+                sup_xml_path, _default_supervisor_xml(), skip_mkdir=True
+            )
+        )
+    if input_data is not None:
+        writes.append(lambda: write_input_data(input_path, input_data, skip_mkdir=True))
+    if len(writes) == 1:
+        _write_biu()
+    else:
+        with ThreadPoolExecutor(max_workers=len(writes)) as ex:
+            for fut in [ex.submit(fn) for fn in writes]:
+                fut.result()
+
     cfg = build_run_config(
-        output_directory=out_dir / "output",
+        output_directory=output_directory,
         xml_config_path=biu_xml_path,
         data_input_file=input_path,
         sup_xml_config_path=sup_xml_path,
@@ -282,7 +555,7 @@ def compile(
         neuron_energy_table_path=neuron_energy_table_path,
     )
     cfg_path = out_dir / "config.json"
-    write_json(cfg_path, cfg)
+    write_json(cfg_path, cfg, skip_mkdir=True)
 
     # Persist probe metadata alongside artifacts for later inspection
     if probe_metadata:
@@ -292,6 +565,7 @@ def compile(
             {
                 "probes": [meta.to_dict() for meta in probe_metadata.values()],
             },
+            skip_mkdir=True,
         )
 
     return CompiledModel(
@@ -311,8 +585,8 @@ class LayerProbe:
 
     _SIGNAL_CASTERS: Dict[str, Callable[[str], int | float]] = {
         "spikes": int,
-        "vin": float,
-        "vns": float,
+        "vin": _fast_float,  # plain float when fastnumbers is not installed
+        "vns": _fast_float,
     }
 
     def __init__(self, layer_idx: int, output_dir: Path, metadata: Optional[ProbeMetadata] = None):
@@ -501,6 +775,59 @@ class LayerProbe:
 
         return pd.DataFrame(data)
 
+    # ------------------------------------------------------------------
+    # Consolidated binary traces
+    # ------------------------------------------------------------------
+    def consolidate(self, signal: str) -> Path:
+        """Stack all per-neuron text traces for `signal` into one ``.npy`` file.
+
+        The simulator writes one text file per neuron; for wide layers that
+        means N open/parse/close cycles on every ``get_all_*`` call. This
+        builds a single 2-D array (one row per neuron, in ascending neuron
+        order) next to the text files so later reads can memmap it.
+
+        Raises:
+            RuntimeError: If numpy is not installed.
+            ValueError: If no traces exist or trace lengths differ.
+        """
+        if _np is None:
+            raise RuntimeError(
+                "numpy is required for LayerProbe.consolidate(); "
+                "install it via 'pip install numpy'."
+            )
+        indices = self._list_neuron_indices(signal=signal)
+        if not indices:
+            raise ValueError(f"No {signal} traces found for layer {self.layer_idx}")
+        rows = [self._read_signal(signal, idx) for idx in indices]
+        lengths = {len(row) for row in rows}
+        if len(lengths) > 1:
+            raise ValueError(f"{signal} traces have mismatched lengths: {sorted(lengths)}")
+        dtype = _np.int8 if signal == "spikes" else _np.float64
+        path = self._consolidated_path(signal)
+        _np.save(path, _np.asarray(rows, dtype=dtype))
+        return path
+
+    def load_signal_matrix(self, signal: str):
+        """Return the consolidated 2-D trace array for `signal`, memmapped.
+
+        Consolidates on first use; subsequent calls map the ``.npy`` file
+        without loading it into memory. Rows follow ascending neuron order.
+        """
+        if _np is None:
+            raise RuntimeError(
+                "numpy is required for LayerProbe.load_signal_matrix(); "
+                "install it via 'pip install numpy'."
+            )
+        path = self._consolidated_path(signal)
+        if not path.exists():
+            self.consolidate(signal)
+        return _np.load(path, mmap_mode="r")
+
+    def _consolidated_path(self, signal: str) -> Path:
+        if signal not in self._SIGNAL_CASTERS:
+            raise ValueError(f"Unsupported signal '{signal}'. Valid options: {tuple(self._SIGNAL_CASTERS)}")
+        return self.output_dir / f"{signal}_{self.layer_idx}.npy"
+
     # ------------------------------------------------------------------
     # Metadata & utilities
     # ------------------------------------------------------------------
@@ -529,6 +856,10 @@ class LayerProbe:
         if not path.exists():
             raise FileNotFoundError(f"{signal} file not found: {path}")
         caster = self._SIGNAL_CASTERS[signal]
+        if _np is not None:
+            # Parse the whole column in C; tolist() keeps the plain-list API.
+            dtype = _np.int64 if caster is int else _np.float64
+            return _np.loadtxt(path, dtype=dtype, ndmin=1).tolist()
         with path.open() as fh:
             return [caster(line.strip()) for line in fh if line.strip()]
 
@@ -540,15 +871,33 @@ class LayerProbe:
             raise FileNotFoundError(f"{signal} file not found: {path}")
         caster = self._SIGNAL_CASTERS[signal]
         chunk: list[int | float] = []
-        with path.open() as fh:
-            for raw_line in fh:
-                line = raw_line.strip()
-                if not line:
-                    continue
-                chunk.append(caster(line))
-                if len(chunk) >= chunk_size:
-                    yield chunk
-                    chunk = []
+        # mmap the file and tokenize newline-aligned windows in bulk instead
+        # of walking buffered text IO line by line; int()/float() parse the
+        # bytes tokens directly.
+        with path.open("rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size == 0:
+                return
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                pos = 0
+                while pos < size:
+                    stop = min(pos + _ITER_WINDOW, size)
+                    if stop < size:
+                        # Align the window to a value boundary.
+                        nl = mm.rfind(b"\n", pos, stop)
+                        if nl == -1:
+                            nl = mm.find(b"\n", stop)
+                        stop = size if nl == -1 else nl + 1
+                    region = mm[pos:stop]
+                    pos = stop
+                    for token in region.split():
+                        chunk.append(caster(token))
+                        if len(chunk) >= chunk_size:
+                            yield chunk
+                            chunk = []
+            finally:
+                mm.close()
         if chunk:
             yield chunk
 
@@ -566,15 +915,20 @@ class LayerProbe:
             return list(range(self.metadata.layer_size))
 
         pattern_signal = signal or "spikes"
-        pattern = f"{pattern_signal}_{self.layer_idx}_*.txt"
+        # One scandir pass with string prefix/suffix checks instead of glob's
+        # per-entry pattern matching.
+        prefix = f"{pattern_signal}_{self.layer_idx}_"
         indices: set[int] = set()
-        for path in self.output_dir.glob(pattern):
-            parts = path.stem.split("_")
-            if len(parts) == 3:
-                try:
-                    indices.add(int(parts[2]))
-                except ValueError:
-                    continue
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(".txt"):
+                        idx_part = name[len(prefix):-4]
+                        if idx_part.isdigit():
+                            indices.add(int(idx_part))
+        except FileNotFoundError:
+            return []
         return sorted(indices)
 
 
@@ -704,6 +1058,10 @@ def build_run_config(
     def to_abs(p: Optional[Path]) -> Optional[str]:
         if p is None:
             return None
+        # resolve() lstats every path component; skip it for paths that are
+        # already absolute and contain no ".." to collapse.
+        if p.is_absolute() and ".." not in p.parts:
+            return str(p)
         return str(p.resolve())
 
     cfg: dict[str, str] = {
@@ -720,16 +1078,50 @@ def build_run_config(
     return cfg
 
 
-def write_input_data(path: Path, data: InputData) -> None:
+def quantize_weights(
+    weights: Sequence[Sequence[Number]],
+    bits: int = 8,
+) -> tuple[list[list[int]], float]:
+    """Quantize a weight matrix to signed integers with symmetric-max scaling.
+
+    Returns `(quantized, scale)` where `quantized[i][j] * scale` approximates
+    the original weight. Integer weights serialize to much shorter strings,
+    shrinking biu.xml for low-precision (DSBitWidth 4/8) targets. This is an
+    explicit, opt-in transform: callers must account for `scale` themselves,
+    since the simulator consumes weight values as-is.
+    """
+    if bits not in {4, 8}:
+        raise ValueError("bits must be 4 or 8")
+    qmax = (1 << (bits - 1)) - 1
+    max_abs = max((abs(float(v)) for row in weights for v in row), default=0.0)
+    if max_abs == 0.0:
+        return [[0 for _ in row] for row in weights], 1.0
+    scale = max_abs / qmax
+    return [[round(float(v) / scale) for v in row] for row in weights], scale
+
+
+def write_input_data(path: Path, data: InputData, *, skip_mkdir: bool = False) -> None:
     """Write input samples to ``path``.
 
     Each entry can be:
       - a single numeric value -> written as one value per line.
       - an iterable of numeric values -> written space-separated on a single line.
       - a preformatted ``str``/``bytes`` line (newline trimming is handled automatically).
+
+    A 2-D numpy array is written in one vectorized pass (one row per line).
+    Pass ``skip_mkdir=True`` when the parent directory is known to exist.
     """
 
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if not skip_mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    if _np is not None and isinstance(data, _np.ndarray):
+        # Bulk path: numpy formats the whole series in C with one pass
+        # instead of one str()/join round-trip per sample. %.17g round-trips
+        # float64 exactly; %g would quietly round the input signal.
+        with path.open("wb") as fh:
+            _np.savetxt(fh, data, fmt="%.17g", delimiter=" ")
+        return
 
     def _normalize(sample: InputSample) -> bytes:
         if isinstance(sample, bytes):
@@ -737,30 +1129,69 @@ def write_input_data(path: Path, data: InputData) -> None:
         if isinstance(sample, str):
             return sample.rstrip("\n").encode("utf-8") + b"\n"
         if isinstance(sample, IterableABC) and not isinstance(sample, (int, float)):
-            line = " ".join(str(v) for v in sample)
+            line = " ".join(map(str, sample))
             return line.encode("utf-8") + b"\n"
         return f"{sample}\n".encode("utf-8")
 
-    with path.open("wb") as fh:
+    # A 1 MiB buffer batches the many small per-sample writes into few
+    # syscalls for long time series.
+    with path.open("wb", buffering=1 << 20) as fh:
         for value in data:
             fh.write(_normalize(value))
 
 
-def write_text(path: Path, content: str) -> None:
-    """Write UTF‑8 text to `path`, creating parent directories as needed."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+def write_text(path: Path, content: Union[str, bytes], *, skip_mkdir: bool = False) -> None:
+    """Write UTF‑8 text (or pre-encoded bytes) to `path`.
 
+    Bytes are written as-is via `write_bytes`; strings are encoded once and
+    written the same way, skipping the TextIOWrapper round-trip of
+    `write_text`. Pass `skip_mkdir=True` when the parent directory is known
+    to exist to avoid a redundant mkdir/stat per call.
+    """
+    if not skip_mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    path.write_bytes(content)
 
-def write_json(path: Path, data: dict) -> None:
-    """Write pretty‑printed JSON to `path` (UTF‑8), ensuring parent dirs exist."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
+def write_json(path: Path, data: dict, *, skip_mkdir: bool = False) -> None:
+    """Write pretty‑printed JSON to `path` (UTF‑8), ensuring parent dirs exist.
 
-def os_path_relativize(p: Path, base: Path) -> Path:
-    # Deprecated in favor of absolute paths; kept for backward compatibility.
-    return p
+    Pass `skip_mkdir=True` when the parent directory is known to exist to
+    avoid a redundant mkdir/stat per call.
+    """
+    if not skip_mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if _orjson is not None:
+        path.write_bytes(_orjson.dumps(data, option=_orjson.OPT_INDENT_2) + b"\n")
+        return
+    # Stream into the buffered file object instead of materializing the whole
+    # document as one string first.
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+
+
+def _write_text_batch(*files: tuple[Path, str]) -> None:
+    """Write several text files via raw `os.open`/`os.write` calls.
+
+    Opens every fd before the first write so the artifacts are emitted
+    back-to-back without per-file TextIOWrapper setup/teardown.
+    """
+    fds: list[int] = []
+    try:
+        for path, _ in files:
+            fds.append(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+        for fd, (_, content) in zip(fds, files):
+            # os.write may short-write (signals, rlimits); drain like
+            # _PipeSink.feed does so artifacts are never silently truncated.
+            view = memoryview(content.encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view) :]
+    finally:
+        for fd in fds:
+            os.close(fd)
 
 
 def compile_and_write(
@@ -789,12 +1220,17 @@ def compile_and_write(
         layers=layers,
         include_supervisor=include_supervisor,
     )
+    # Create the output tree once up front so individual writes skip mkdir.
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "output").mkdir(exist_ok=True)
     biu_xml_path = out_dir / "biu.xml"
-    write_text(biu_xml_path, biu_xml)
     sup_xml_path = None
     if sup_xml is not None:
+        # Both XML artifacts share a parent; emit them in one batched write.
         sup_xml_path = out_dir / "supervisor.xml"
-        write_text(sup_xml_path, sup_xml)
+        _write_text_batch((biu_xml_path, biu_xml), (sup_xml_path, sup_xml))
+    else:
+        write_text(biu_xml_path, biu_xml, skip_mkdir=True)
 
     if input_data is not None:
         input_path = out_dir / "input.txt"
@@ -812,7 +1248,7 @@ def compile_and_write(
         synapses_energy_table_path=synapses_energy_table_path,
         neuron_energy_table_path=neuron_energy_table_path,
     )
-    write_json(out_dir / "config.json", cfg)
+    write_json(out_dir / "config.json", cfg, skip_mkdir=True)
 
     if probe_metadata:
         write_json(
@@ -820,5 +1256,6 @@ def compile_and_write(
             {
                 "probes": [meta.to_dict() for meta in probe_metadata.values()],
             },
+            skip_mkdir=True,
         )
     return cfg
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence
+
+try:  # numpy is optional; used only as a fast path for wide override ranges
+    import numpy as _np
+except ModuleNotFoundError:  # pragma: no cover - exercised on numpy-less installs
+    _np = None  # type: ignore[assignment]
 
 
 @dataclass(slots=True)
@@ -30,14 +35,24 @@ class BIUNetworkDefaults:
     DSBitWidth: Optional[int] = None  # {4, 8}
     DSClockMHz: Optional[float] = None  # > 0
     DSMode: Optional[str] = None  # ThresholdMode | FrequencyMode
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Any field mutation invalidates the cached validation result.
+        if name != "_validated":
+            object.__setattr__(self, "_validated", False)
+        object.__setattr__(self, name, value)
 
     def validate(self) -> None:
+        if self._validated:
+            return
         if self.DSBitWidth is not None and self.DSBitWidth not in {4, 8}:
             raise ValueError("DSBitWidth must be 4 or 8")
         if self.DSClockMHz is not None and self.DSClockMHz <= 0:
             raise ValueError("DSClockMHz must be positive")
         if self.DSMode is not None and self.DSMode not in {"ThresholdMode", "FrequencyMode", ""}:
             raise ValueError("DSMode must be 'ThresholdMode' or 'FrequencyMode'")
+        self._validated = True
 
 
 @dataclass(slots=True)
@@ -45,20 +60,43 @@ class Synapses:
     """Incoming synapse matrix for a layer.
 
     - rows × cols defines the expected shape
-    - weights must contain exactly `rows` lists, each with `cols` numbers
+    - weights must contain exactly `rows` lists, each with `cols` numbers,
+      or equivalently a 2-D numpy array of shape (rows, cols). The array
+      form stores cells contiguously (float32/float64) instead of one
+      PyFloat object per cell, which matters for large dense matrices.
     """
     rows: int
     cols: int
-    weights: List[List[float]]
+    weights: "List[List[float]] | Any"  # 2-D np.ndarray accepted when numpy is installed
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Any field mutation invalidates the cached validation result.
+        if name != "_validated":
+            object.__setattr__(self, "_validated", False)
+        object.__setattr__(self, name, value)
 
     def validate(self) -> None:
+        if self._validated:
+            return
         if self.rows <= 0 or self.cols <= 0:
             raise ValueError("synapses rows and cols must be positive")
+        if _np is not None and isinstance(self.weights, _np.ndarray):
+            # One shape comparison replaces the per-row length scan.
+            if self.weights.shape != (self.rows, self.cols):
+                raise ValueError("weights array must have shape (rows, cols)")
+            self._validated = True
+            return
         if len(self.weights) != self.rows:
             raise ValueError("weights must contain exactly 'rows' rows")
         for i, row in enumerate(self.weights):
             if len(row) != self.cols:
                 raise ValueError(f"weights row {i} must have exactly 'cols' entries")
+        # Normalize cells to float once so downstream emitters can take a
+        # branchless float-only path (numpy arrays are already homogeneous).
+        if isinstance(self.weights, list):
+            self.weights = [[float(x) for x in row] for row in self.weights]
+        self._validated = True
 
 
 @dataclass(slots=True)
@@ -106,12 +144,23 @@ class Layer:
     neurons: List[NeuronOverride] = field(default_factory=list)
     probe: Optional[str] = None
     """Optional probe name for easy access to layer data after simulation.
-    
+
     If provided, allows accessing layer output data (spikes, vin, vns) by name
     without needing to know the layer index or manually open files.
     """
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Any field mutation invalidates the cached validation result. Note
+        # that in-place mutation of nested synapses/ranges/neurons objects is
+        # not tracked; reassign the field to force re-validation.
+        if name != "_validated":
+            object.__setattr__(self, "_validated", False)
+        object.__setattr__(self, name, value)
 
     def validate(self) -> None:
+        if self._validated:
+            return
         if self.size <= 0:
             raise ValueError("Layer size must be positive")
         self.synapses.validate()
@@ -121,6 +170,7 @@ class Layer:
             r.validate(self.size)
         for n in self.neurons:
             n.validate(self.size)
+        self._validated = True
 
 
 def _iter_optional(tag: str, value: Optional[float | int | str]) -> Iterable[tuple[str, str]]:
@@ -143,6 +193,17 @@ def materialize_precedence(
         Keys: "VTh", "RLeak", "refractory". Values are lists (length `size`) that
         contain the resolved scalar per neuron; entries may be None if not set.
     """
+    # Common case: no overrides at all — just broadcast the defaults.
+    if not ranges and not neurons:
+        return {
+            "VTh": [defaults.VTh] * size,
+            "RLeak": [defaults.RLeak] * size,
+            "refractory": [defaults.refractory] * size,
+        }
+
+    if _np is not None:
+        return _materialize_precedence_np(size, defaults, ranges, neurons)
+
     vth: List[Optional[float]] = [defaults.VTh] * size
     rleak: List[Optional[float]] = [defaults.RLeak] * size
     ref: List[Optional[int]] = [defaults.refractory] * size
@@ -169,3 +230,29 @@ def materialize_precedence(
     return {"VTh": vth, "RLeak": rleak, "refractory": ref}
 
 
+def _materialize_precedence_np(
+    size: int,
+    defaults: BIUNetworkDefaults,
+    ranges: Sequence[NeuronOverrideRange],
+    neurons: Sequence[NeuronOverride],
+) -> dict[str, List[Optional[float | int]]]:
+    """Vectorized materialize_precedence: one slice assignment per range.
+
+    Unset entries are tracked as NaN and mapped back to None at the end so the
+    returned structure matches the pure-Python implementation.
+    """
+    out: dict[str, List[Optional[float | int]]] = {}
+    for attr, cast in (("VTh", float), ("RLeak", float), ("refractory", int)):
+        base = getattr(defaults, attr)
+        vec = _np.full(size, _np.nan if base is None else base, dtype=_np.float64)
+        for r in ranges:
+            value = getattr(r, attr)
+            if value is not None:
+                vec[r.start : r.end + 1] = value
+        idx = [n.index for n in neurons if getattr(n, attr) is not None]
+        if idx:
+            vec[idx] = [getattr(n, attr) for n in neurons if getattr(n, attr) is not None]
+        out[attr] = [None if _np.isnan(v) else cast(v) for v in vec.tolist()]
+    return out
+
+
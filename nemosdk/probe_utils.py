@@ -4,10 +4,75 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Iterator, Optional
+import ctypes
+import ctypes.util
+import mmap
+import os
+import select
+import sys
 import time
 
 from .compiler import LayerProbe
 
+# inotify constants (from <sys/inotify.h>); used to wait for file events
+# instead of sleep-polling. Only available on Linux.
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+
+_libc = None
+if sys.platform == "linux":
+    try:  # pragma: no cover - depends on host libc
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.inotify_init1
+        _libc.inotify_add_watch
+    except (OSError, AttributeError):  # pragma: no cover
+        _libc = None
+
+
+class _FileWatch:
+    """Blocks on inotify events for a path instead of fixed-interval sleeps.
+
+    Use :func:`_watch_events`, which returns None when inotify is unavailable
+    (non-Linux, odd libc) so callers can fall back to ``time.sleep``.
+    """
+
+    __slots__ = ("fd",)
+
+    def __init__(self, path: Path, mask: int) -> None:
+        fd = _libc.inotify_init1(_IN_NONBLOCK)  # type: ignore[union-attr]
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = _libc.inotify_add_watch(fd, os.fsencode(path), mask)  # type: ignore[union-attr]
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+        self.fd = fd
+
+    def wait(self, timeout: Optional[float]) -> None:
+        """Sleep until an event arrives or ``timeout`` elapses, then drain."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                os.read(self.fd, 4096)
+            except BlockingIOError:  # pragma: no cover - drained by racing event
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _watch_events(path: Path, mask: int) -> Optional[_FileWatch]:
+    """Return a `_FileWatch` on ``path``, or None when inotify is unusable."""
+    if _libc is None:
+        return None
+    try:
+        return _FileWatch(path, mask)
+    except OSError:  # pragma: no cover - e.g. watch limit exhausted
+        return None
+
 
 def watch_probe(
     probe: LayerProbe,
@@ -42,9 +107,11 @@ def watch_probe(
         ValueError: If an unsupported signal is requested.
     """
 
-    path: Path = probe._signal_path(signal, neuron_idx)  # type: ignore[attr-defined]
-    if signal not in probe.available_signals():
+    # Validate the signal with one dict lookup before building any paths.
+    caster = probe._SIGNAL_CASTERS.get(signal)  # type: ignore[attr-defined]
+    if caster is None:
         raise ValueError(f"Unsupported signal '{signal}'. Valid options: {probe.available_signals()}")
+    path: Path = probe._signal_path(signal, neuron_idx)  # type: ignore[attr-defined]
 
     if not path.exists():
         if not wait_for_file:
@@ -52,31 +119,112 @@ def watch_probe(
         deadline: Optional[float] = None
         if wait_timeout is not None:
             deadline = time.monotonic() + wait_timeout
-        while not path.exists():
-            if deadline is not None and time.monotonic() >= deadline:
-                raise TimeoutError(
-                    f"Timed out waiting for {signal} file: {path}"
-                )
-            time.sleep(poll_interval)
-
-    caster = probe._SIGNAL_CASTERS[signal]  # type: ignore[attr-defined]
+        # Prefer an inotify watch on the parent directory so the file's
+        # appearance wakes us immediately; re-check existence after creating
+        # the watch to close the race with a concurrent writer.
+        dir_watch = _watch_events(path.parent, _IN_CREATE | _IN_MOVED_TO)
+        try:
+            while not path.exists():
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for {signal} file: {path}"
+                        )
+                else:
+                    remaining = poll_interval
+                if dir_watch is not None:
+                    dir_watch.wait(remaining)
+                else:
+                    time.sleep(min(poll_interval, remaining))
+        finally:
+            if dir_watch is not None:
+                dir_watch.close()
+
+    fast_spikes = signal == "spikes"
+    if fast_spikes:
+        # Spike samples are single ASCII digits: map b"0"/b"1" by byte
+        # arithmetic instead of running the full int() parser per sample.
+        # Non-digit bytes fall through to int(), which raises ValueError
+        # instead of yielding plausible-looking garbage.
+        def caster(raw):  # type: ignore[misc]
+            if len(raw) == 1 and 0x30 <= raw[0] <= 0x39:
+                return raw[0] - 48
+            return int(raw)
     yielded = 0
 
-    with path.open() as fh:
+    # Map the file read-only and scan for newlines in place: no per-line
+    # read syscalls and no copies out of the page cache. When the writer
+    # appends, a fresh map over the new size picks up the growth; int()/
+    # float() accept bytes directly, so lines never need decoding.
+    fd = os.open(path, os.O_RDONLY)
+    file_watch = _watch_events(path, _IN_MODIFY) if follow else None
+    mm: Optional[mmap.mmap] = None
+    try:
+        size = os.fstat(fd).st_size
+        if size:
+            mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+        pos = 0
         while True:
-            line = fh.readline()
-            if line:
-                value_str = line.strip()
-                if not value_str:
-                    continue
-                value = caster(value_str)
-                yield value
-                yielded += 1
-                if max_events is not None and yielded >= max_events:
-                    break
+            if fast_spikes and mm is not None:
+                # Spike files are fixed-width 2-byte records ("0\n"/"1\n"),
+                # so decode every complete record in the map at once with
+                # C-speed strided slices; one layout check guards the batch
+                # and anything irregular drops to the generic line scanner.
+                end = mm.rfind(b"\n", pos)
+                if end != -1:
+                    region = mm[pos : end + 1]
+                    n = len(region)
+                    data = region[::2]
+                    if n % 2 == 0 and data.isdigit() and region[1::2] == b"\n" * (n // 2):
+                        pos = end + 1
+                        for v in data:
+                            yield v - 48
+                            yielded += 1
+                            if max_events is not None and yielded >= max_events:
+                                return
+                        continue
+                    fast_spikes = False
+            nl = mm.rfind(b"\n", pos) if mm is not None else -1
+            if nl != -1:
+                # Tokenize every complete line at once: bytes.split runs at C
+                # speed and drops blank lines for free, so the interpreter
+                # only executes one cast per sample instead of a find/slice/
+                # strip round-trip per line.
+                region = mm[pos:nl]
+                pos = nl + 1
+                for token in region.split():
+                    yield caster(token)
+                    yielded += 1
+                    if max_events is not None and yielded >= max_events:
+                        return
+                continue
+            # No complete line left in the map — remap if the file grew.
+            new_size = os.fstat(fd).st_size
+            if new_size > size:
+                if mm is not None:
+                    mm.close()
+                mm = mmap.mmap(fd, new_size, access=mmap.ACCESS_READ)
+                size = new_size
+                continue
+            if not follow:
+                # Flush a trailing sample that lacks a final newline.
+                if mm is not None:
+                    tail = mm[pos:size].strip()
+                    if tail:
+                        yield caster(tail)
+                break
+            if max_events is not None and yielded >= max_events:
+                break
+            if file_watch is not None:
+                # Wakes as soon as the writer appends; poll_interval caps
+                # the wait so behaviour degrades to the old polling.
+                file_watch.wait(poll_interval)
             else:
-                if not follow:
-                    break
-                if max_events is not None and yielded >= max_events:
-                    break
                 time.sleep(poll_interval)
+    finally:
+        if mm is not None:
+            mm.close()
+        if file_watch is not None:
+            file_watch.close()
+        os.close(fd)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, List, Mapping, Optional, Sequence
-import datetime as _dt
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
 import os
+import selectors
+import stat
 import subprocess
 import sys
-import threading
+import time
 
 try:
     from .compiler import CompiledModel
@@ -15,10 +16,10 @@ except Exception:  # pragma: no cover - avoid import cycles during type checking
     CompiledModel = None  # type: ignore
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RunResult:
     """Immutable result summary for a simulator invocation.
-    
+
     Attributes:
         returncode: Process exit code (0 = success, non-zero = failure)
         command: Full command line that was executed
@@ -27,7 +28,7 @@ class RunResult:
         stderr_path: Path to the stderr log file (contains error details if returncode != 0)
     """
     returncode: int
-    command: List[str]
+    command: Tuple[str, ...]
     cwd: Path
     stdout_path: Path
     stderr_path: Path
@@ -55,6 +56,90 @@ class NemoSimRunner:
             self.binary_path = Path(os.getenv("NEMOSIM_BINARY"))
         else:
             self.binary_path = working_dir / "NEMOSIM"
+        # Path to the binary that's valid after chdir into working_dir;
+        # fixed per runner, so computed once here instead of per run().
+        if self.binary_path.is_absolute():
+            self._bin_arg = str(self.binary_path)
+        else:
+            self._bin_arg = "./" + self.binary_path.name
+        self._paths_validated = False
+
+    def _prepare_invocation(
+        self,
+        compiled: "CompiledModel",
+        extra_args: Optional[Sequence[str]],
+        logs_dir: Optional[Path],
+    ) -> Tuple[List[str], Path, Path]:
+        """Validate paths and build the command line plus timestamped log paths."""
+        config_path = compiled.get_config_path().resolve()
+        # Both paths are fixed per runner, so validate them once and skip the
+        # stat syscalls on repeat runs (sweeps reuse one runner heavily).
+        if not self._paths_validated:
+            _stat_or_raise(
+                self.working_dir,
+                want_dir=True,
+                missing=f"Invalid working directory: {self.working_dir}",
+                wrong_type=f"Invalid working directory: {self.working_dir}",
+            )
+            _stat_or_raise(
+                self.binary_path,
+                want_dir=False,
+                missing=f"Simulator binary not found: {self.binary_path}",
+                wrong_type=f"Simulator binary is not a file: {self.binary_path}",
+            )
+            self._paths_validated = True
+
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        tm = time.localtime(sec)
+        ts = (
+            f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+            f"_{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}_{ns // 1000:06d}"
+        )
+        logs_dir = logs_dir or (self.working_dir / "logs")
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        stdout_path = logs_dir / f"nemosim_stdout_{ts}.log"
+        stderr_path = logs_dir / f"nemosim_stderr_{ts}.log"
+
+        args: List[str] = [self._bin_arg, str(config_path)]
+        if extra_args:
+            args.extend(list(extra_args))
+        return args, stdout_path, stderr_path
+
+    def spawn(
+        self,
+        compiled: "CompiledModel",
+        *,
+        extra_args: Optional[Sequence[str]] = None,
+        logs_dir: Optional[Path] = None,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> subprocess.Popen:
+        """Start the simulator without waiting for it to finish.
+
+        Logging matches `run()`: stdout/stderr go straight to timestamped files
+        under `logs_dir` (defaults to `working_dir/logs`). The caller owns the
+        process lifecycle — call `proc.wait()` (or `proc.poll()`) and inspect
+        `proc.returncode`. Useful for overlapping a simulation with other work,
+        or for driving several compiled models concurrently from one process.
+        """
+        args, stdout_path, stderr_path = self._prepare_invocation(compiled, extra_args, logs_dir)
+        out_fd = os.open(stdout_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        err_fd = -1
+        try:
+            err_fd = os.open(stderr_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            proc = subprocess.Popen(
+                args,
+                cwd=str(self.working_dir),
+                stdout=out_fd,
+                stderr=err_fd,
+                env=dict(env) if env is not None else None,
+            )
+        finally:
+            # The child holds its own duplicates; drop the parent copies now so
+            # the log files close as soon as the simulator exits.
+            if err_fd != -1:
+                os.close(err_fd)
+            os.close(out_fd)
+        return proc
 
     def run(
         self,
@@ -95,41 +180,24 @@ class NemoSimRunner:
             - 0 = Success
             - Non-zero = Failure (error details in stderr log)
         """
-        config_path = compiled.get_config_path().resolve()
-        if not self.working_dir.exists():
-            raise FileNotFoundError(f"Invalid working directory: {self.working_dir}")
-        if not self.binary_path.exists():
-            raise FileNotFoundError(f"Simulator binary not found: {self.binary_path}")
-        if not self.binary_path.is_file():
-            raise FileNotFoundError(f"Simulator binary is not a file: {self.binary_path}")
-
-        ts = _dt.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        logs_dir = logs_dir or (self.working_dir / "logs")
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        stdout_path = logs_dir / f"nemosim_stdout_{ts}.log"
-        stderr_path = logs_dir / f"nemosim_stderr_{ts}.log"
+        args, stdout_path, stderr_path = self._prepare_invocation(compiled, extra_args, logs_dir)
 
         mirror_stdout = stream_output or stdout_callback is not None
         mirror_stderr = stream_output or stderr_callback is not None
 
-        # Use a path to the binary that's valid after chdir into working_dir
-        if Path(self.binary_path).is_absolute():
-            bin_arg = str(self.binary_path)
-        else:
-            bin_arg = "./" + Path(self.binary_path).name
-        args: List[str] = [bin_arg, str(config_path)]
-        if extra_args:
-            args.extend(list(extra_args))
-
-        with stdout_path.open("w", encoding="utf-8") as out_fh, stderr_path.open("w", encoding="utf-8") as err_fh:
+        # Raw fds skip the buffered-IO layer entirely: the child (or the
+        # selector drain) writes bytes straight to the log files.
+        out_fd = os.open(stdout_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        err_fd = -1
+        try:
+            err_fd = os.open(stderr_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
             if not mirror_stdout and not mirror_stderr:
                 try:
                     proc = subprocess.run(
                         args,
                         cwd=str(self.working_dir),
-                        stdout=out_fh,
-                        stderr=err_fh,
-                        text=True,
+                        stdout=out_fd,
+                        stderr=err_fd,
                         check=False,
                         timeout=timeout,
                         env=dict(env) if env is not None else None,
@@ -142,71 +210,88 @@ class NemoSimRunner:
                 proc = subprocess.Popen(
                     args,
                     cwd=str(self.working_dir),
-                    stdout=subprocess.PIPE if mirror_stdout else out_fh,
-                    stderr=subprocess.PIPE if mirror_stderr else err_fh,
-                    text=True,
+                    stdout=subprocess.PIPE if mirror_stdout else out_fd,
+                    stderr=subprocess.PIPE if mirror_stderr else err_fd,
+                    bufsize=0,
                     env=dict(env) if env is not None else None,
                 )
 
-                threads: list[threading.Thread] = []
-
-                def _make_forwarder(
-                    stream,
-                    log_file,
-                    *,
-                    callback: Optional[Callable[[str], None]],
-                    mirror_to: Optional[Callable[[str], None]],
-                ):
-                    def _forward() -> None:
-                        try:
-                            for line in iter(stream.readline, ""):
-                                log_file.write(line)
-                                log_file.flush()
-                                if callback is not None:
-                                    callback(line)
-                                if mirror_to is not None:
-                                    mirror_to(line)
-                        finally:
-                            stream.close()
-
-                    return _forward
-
+                # Drain both pipes from the main thread with one selector
+                # (epoll on Linux) instead of spawning a thread per stream.
+                sel = selectors.DefaultSelector()
                 if mirror_stdout and proc.stdout is not None:
-                    stdout_forward = _make_forwarder(
+                    sink = _PipeSink(
                         proc.stdout,
-                        out_fh,
+                        out_fd,
                         callback=stdout_callback,
                         mirror_to=_build_mirror_fn(stream_output, sys.stdout),
                     )
-                    threads.append(threading.Thread(target=stdout_forward, daemon=True))
-
+                    os.set_blocking(proc.stdout.fileno(), False)
+                    sel.register(proc.stdout.fileno(), selectors.EVENT_READ, data=sink)
                 if mirror_stderr and proc.stderr is not None:
-                    stderr_forward = _make_forwarder(
+                    sink = _PipeSink(
                         proc.stderr,
-                        err_fh,
+                        err_fd,
                         callback=stderr_callback,
                         mirror_to=_build_mirror_fn(stream_output, sys.stderr),
                     )
-                    threads.append(threading.Thread(target=stderr_forward, daemon=True))
-
-                for thread in threads:
-                    thread.start()
+                    os.set_blocking(proc.stderr.fileno(), False)
+                    sel.register(proc.stderr.fileno(), selectors.EVENT_READ, data=sink)
 
+                deadline = time.monotonic() + timeout if timeout is not None else None
+                timed_out = False
                 try:
-                    proc.wait(timeout=timeout)
-                except subprocess.TimeoutExpired as exc:
-                    proc.kill()
-                    proc.wait()
-                    raise TimeoutError(
-                        f"Simulator timed out after {timeout} seconds. See logs: {stdout_path}, {stderr_path}"
-                    ) from exc
+                    while sel.get_map():
+                        if deadline is not None:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                timed_out = True
+                                break
+                        else:
+                            remaining = None
+                        for key, _ in sel.select(remaining):
+                            chunk = os.read(key.fd, 65536)
+                            if chunk:
+                                key.data.feed(chunk)
+                            else:
+                                sel.unregister(key.fd)
+                                key.data.finish()
+                    if not timed_out:
+                        # Poll instead of blocking in proc.wait() so Ctrl-C is
+                        # handled promptly; tear the child down before re-raising.
+                        try:
+                            while proc.poll() is None:
+                                if deadline is not None and time.monotonic() >= deadline:
+                                    timed_out = True
+                                    break
+                                time.sleep(0.05)
+                        except KeyboardInterrupt:
+                            proc.terminate()
+                            try:
+                                proc.wait(timeout=5)
+                            except subprocess.TimeoutExpired:
+                                proc.kill()
+                                proc.wait()
+                            raise
+                    if timed_out:
+                        proc.kill()
+                        proc.wait()
+                        raise TimeoutError(
+                            f"Simulator timed out after {timeout} seconds. See logs: {stdout_path}, {stderr_path}"
+                        )
                 finally:
-                    for thread in threads:
-                        thread.join()
+                    for key in list(sel.get_map().values()):
+                        sel.unregister(key.fd)
+                        key.data.finish()
+                    sel.close()
+        finally:
+            if err_fd != -1:
+                os.close(err_fd)
+            os.close(out_fd)
 
         result = RunResult(
             returncode=proc.returncode,
-            command=args,
+            command=tuple(args),
             cwd=self.working_dir,
             stdout_path=stdout_path,
             stderr_path=stderr_path,
@@ -218,6 +303,72 @@ class NemoSimRunner:
         return result
 
 
+def _stat_or_raise(path: Path, *, want_dir: bool, missing: str, wrong_type: str) -> None:
+    """Validate `path` with a single stat call instead of exists()+is_file()."""
+    try:
+        st = os.stat(path)
+    except OSError as exc:
+        raise FileNotFoundError(missing) from exc
+    if want_dir:
+        if not stat.S_ISDIR(st.st_mode):
+            raise FileNotFoundError(wrong_type)
+    elif not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(wrong_type)
+
+
+class _PipeSink:
+    """Per-pipe state for the selector drain loop in `NemoSimRunner.run`.
+
+    Writes raw chunks to the log fd; lines are only split out (and decoded)
+    when a callback or stream mirror needs them.
+    """
+
+    __slots__ = ("stream", "log_fd", "callback", "mirror_to", "_remainder", "_wants_lines")
+
+    def __init__(
+        self,
+        stream,
+        log_fd: int,
+        *,
+        callback: Optional[Callable[[str], None]],
+        mirror_to: Optional[Callable[[str], None]],
+    ) -> None:
+        self.stream = stream
+        self.log_fd = log_fd
+        self.callback = callback
+        self.mirror_to = mirror_to
+        self._remainder = bytearray()
+        self._wants_lines = callback is not None or mirror_to is not None
+
+    def _emit(self, line: str) -> None:
+        if self.callback is not None:
+            self.callback(line)
+        if self.mirror_to is not None:
+            self.mirror_to(line)
+
+    def feed(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(self.log_fd, view) :]
+        if not self._wants_lines:
+            return
+        remainder = self._remainder
+        remainder += chunk
+        start = 0
+        while (nl := remainder.find(b"\n", start)) != -1:
+            self._emit(remainder[start : nl + 1].decode("utf-8", "replace"))
+            start = nl + 1
+        if start:
+            del remainder[:start]
+
+    def finish(self) -> None:
+        """Flush a trailing unterminated line and close the pipe."""
+        if self._wants_lines and self._remainder:
+            self._emit(self._remainder.decode("utf-8", "replace"))
+            self._remainder.clear()
+        self.stream.close()
+
+
 def _build_mirror_fn(stream_output: bool, target_stream) -> Optional[Callable[[str], None]]:
     if not stream_output:
         return None
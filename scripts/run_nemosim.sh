@@ -12,11 +12,13 @@ DEFAULT_CONFIG_REL="../../tests/data/multi_layer_test/config.json"
 usage() {
     cat <<EOF
 Usage: $(basename "$0") [CONFIG_JSON|TEST_DIR]
+       $(basename "$0") --batch CONFIGS_TXT
 
 Examples:
   $(basename "$0")                 # run default BIU test
   $(basename "$0") bin/Linux/Tests/SNN/BIU/config.json
   $(basename "$0") bin/Linux/Tests/SNN/BIU             # will use its config.json
+  $(basename "$0") --batch my_configs.txt              # one config path per line
 
 Notes:
   - The simulator is executed from: $BIN_DIR
@@ -26,6 +28,37 @@ EOF
 
 arg="${1:-}" || true
 
+# Batch mode: run several configs from one script invocation. Each config
+# still gets its own simulator process (the binary takes exactly one config
+# and cannot share state across runs); this amortizes shell startup and gives
+# tagged, single-stream output for tooling that drives many scenarios.
+if [[ "$arg" == "--batch" ]]; then
+    BATCH_FILE="${2:-}"
+    if [[ -z "$BATCH_FILE" || ! -f "$BATCH_FILE" ]]; then
+        echo "Error: --batch requires a readable file with one config path per line" >&2
+        exit 1
+    fi
+    if [[ ! -f "$BIN_DIR/NEMOSIM" ]]; then
+        echo "Error: NEMOSIM binary not found at $BIN_DIR/NEMOSIM" >&2
+        exit 1
+    fi
+    while IFS= read -r line || [[ -n "$line" ]]; do
+        # Skip blanks and comments
+        [[ -z "$line" || "$line" == \#* ]] && continue
+        if [[ -f "$line" ]]; then
+            cfg="$(cd "$(dirname "$line")" && pwd)/$(basename "$line")"
+        elif [[ -f "$PROJECT_ROOT/$line" ]]; then
+            cfg="$(cd "$(dirname "$PROJECT_ROOT/$line")" && pwd)/$(basename "$line")"
+        else
+            echo "Error: config '$line' not found" >&2
+            exit 1
+        fi
+        echo "=== Scenario: $cfg"
+        (cd "$BIN_DIR" && "$BIN_DIR/NEMOSIM" "$cfg")
+    done < "$BATCH_FILE"
+    exit 0
+fi
+
 # Determine config path (always resolve to absolute path for invocation)
 CONFIG_ABS=""
 CONFIG_PATH_REL="$DEFAULT_CONFIG_REL"
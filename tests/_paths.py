@@ -0,0 +1,15 @@
+"""Shared filesystem anchors for the test suite."""
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+
+@functools.cache
+def repo_root() -> Path:
+    """Resolve the repository root once per interpreter.
+
+    `Path.resolve()` stats every path component, so the test modules share
+    this cached lookup instead of each resolving their own `__file__`.
+    """
+    return Path(__file__).resolve().parents[1]
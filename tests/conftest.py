@@ -0,0 +1,5 @@
+"""Top-level test configuration.
+
+Its presence puts `tests/` on sys.path under pytest's default import mode,
+which lets the suites import shared helpers such as `_paths`.
+"""
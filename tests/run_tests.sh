@@ -3,5 +3,14 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
-python3 -m unittest discover -s . -p "test*.py" -v
 
+# The simulator scenarios use distinct config files and output dirs, so they
+# are safe to run concurrently; spread them across workers when pytest-xdist
+# is installed, otherwise fall back to a serial unittest run.
+if python3 -c "import pytest, xdist" >/dev/null 2>&1; then
+  python3 -m pytest -q -n auto sim
+elif python3 -c "import pytest" >/dev/null 2>&1; then
+  python3 -m pytest -q sim
+else
+  python3 -m unittest discover -s . -p "test*.py" -v
+fi
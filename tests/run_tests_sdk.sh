@@ -5,6 +5,15 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 
 cd "$PROJECT_ROOT"
-PYTHONPATH=. python3 -m pytest -q tests/sdk
+
+# The probe tests write small fixture files and immediately read them back
+# through the probe API, all in-process. Pointing the pytest base temp at a
+# tmpfs (e.g. PYTEST_TMPDIR=/dev/shm) keeps writer and reader on the same
+# page cache with no disk in the loop.
+if [[ -n "${PYTEST_TMPDIR:-}" ]]; then
+  PYTHONPATH=. python3 -m pytest -q --basetemp="$PYTEST_TMPDIR/nemosdk-tests" tests/sdk
+else
+  PYTHONPATH=. python3 -m pytest -q tests/sdk
+fi
 
 
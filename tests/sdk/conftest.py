@@ -0,0 +1,91 @@
+"""Shared fixtures for the SDK test suite."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Final
+import json
+import os
+import re
+import shutil
+
+import pytest
+
+from nemosdk.compiler import CompiledModel, compile as compile_model
+from nemosdk.model import BIUNetworkDefaults, Layer
+
+
+_OUTPUT_DIR_RE = re.compile(rb'"output_directory"\s*:\s*"[^"]*"')
+
+# Constructed once: every cached compile uses the stock defaults.
+_DEFAULTS: Final[BIUNetworkDefaults] = BIUNetworkDefaults()
+
+
+def _layer_key(layers: list[Layer]) -> tuple:
+    # Every field that feeds the compiled XML must appear here, or a layer
+    # stack differing only in overrides would replay the wrong cached model.
+    return tuple(
+        (
+            lyr.size,
+            lyr.synapses.rows,
+            lyr.synapses.cols,
+            tuple(tuple(row) for row in lyr.synapses.weights),
+            tuple((r.start, r.end, r.VTh, r.RLeak, r.refractory) for r in lyr.ranges),
+            tuple((n.index, n.VTh, n.RLeak, n.refractory) for n in lyr.neurons),
+            lyr.probe,
+        )
+        for lyr in layers
+    )
+
+
+@pytest.fixture(scope="session")
+def compiled_model_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., CompiledModel]:
+    """Memoized model compilation, keyed by layer structure.
+
+    Compiling is the slowest step of the probe tests and most of them reuse a
+    handful of tiny layer stacks, so each unique stack is compiled once per
+    session. Every call writes a fresh config copy under `config_dir` pointing
+    at the caller's `output_dir`, so tests never share mutable state.
+    """
+    cache: dict[tuple, Path] = {}
+
+    def factory(layers: list[Layer], *, output_dir: Path, config_dir: Path) -> CompiledModel:
+        # Callers create output_dir themselves (the probe tests write fixture
+        # files into it before compiling), so no mkdir here.
+        key = _layer_key(layers)
+        model_dir = cache.get(key)
+        if model_dir is None:
+            base = tmp_path_factory.mktemp("models_cache")
+            input_file = base / "input.txt"
+            input_file.write_text("0\n")
+            model_dir = base / "model"
+            compile_model(
+                defaults=_DEFAULTS,
+                layers=layers,
+                out_dir=model_dir,
+                data_input_file=input_file,
+            )
+            cache[key] = model_dir
+
+        # Only output_directory changes per test, so patch the bytes in place
+        # instead of decoding and re-encoding the whole config.
+        cfg_bytes = (model_dir / "config.json").read_bytes()
+        value = json.dumps(str(output_dir.resolve())).encode()
+        cfg_bytes = _OUTPUT_DIR_RE.sub(lambda _: b'"output_directory": ' + value, cfg_bytes, count=1)
+        config_path = config_dir / "config.json"
+        config_path.write_bytes(cfg_bytes)
+
+        # CompiledModel looks for probe metadata next to the config, so the
+        # copy needs probes.json beside it; hardlink instead of copying.
+        probes_src = model_dir / "probes.json"
+        probes_dst = config_dir / "probes.json"
+        if probes_src.exists() and not probes_dst.exists():
+            try:
+                os.link(probes_src, probes_dst)
+            except OSError:  # pragma: no cover - cross-device tmp layouts
+                shutil.copyfile(probes_src, probes_dst)
+
+        return CompiledModel(config_path=config_path)
+
+    return factory
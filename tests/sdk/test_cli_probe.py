@@ -3,7 +3,6 @@ from __future__ import annotations
 import contextlib
 from io import StringIO
 from pathlib import Path
-import json
 import sys
 import threading
 import time
@@ -17,7 +16,6 @@ def _compile_with_output(tmp_path: Path, layers: list[Layer], output_dir: Path)
     """Compile layers and return the config.json path."""
     model_dir = tmp_path / "model"
     model_dir.mkdir(parents=True, exist_ok=True)
-    output_dir.mkdir(parents=True, exist_ok=True)
 
     input_file = tmp_path / "input.txt"
     input_file.write_text("0\n")
@@ -28,13 +26,9 @@ def _compile_with_output(tmp_path: Path, layers: list[Layer], output_dir: Path)
         layers=layers,
         out_dir=model_dir,
         data_input_file=input_file,
+        output_directory=output_dir,
     )
-
-    config_path = compiled.get_config_path()
-    cfg = json.loads(config_path.read_text())
-    cfg["output_directory"] = str(output_dir.resolve())
-    config_path.write_text(json.dumps(cfg, indent=2))
-    return config_path
+    return compiled.get_config_path()
 
 
 def _run_cli(args: list[str]) -> str:
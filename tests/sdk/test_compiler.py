@@ -5,32 +5,63 @@ import xml.etree.ElementTree as ET
 import json
 import pytest
 
+try:  # lxml is optional; its C parser speeds up parsing large compiled documents
+    from lxml import etree as _lxml_etree
+except ModuleNotFoundError:  # pragma: no cover - exercised on lxml-less installs
+    _lxml_etree = None
+
 from nemosdk.model import BIUNetworkDefaults, Layer, Synapses, NeuronOverride, NeuronOverrideRange
-from nemosdk.compiler import compile as compile_model, build_run_config, compile_and_write, write_input_data
+from nemosdk.compiler import compile as compile_model, build_run_config, compile_and_write, quantize_weights, write_input_data
+
+
+def _parse_xml(xml_str: str):
+    """Parse compiled XML, preferring lxml's C parser when it is installed.
+
+    Both parsers share the `find`/`findtext` API the assertions use.
+    """
+    if _lxml_etree is not None:
+        return _lxml_etree.fromstring(xml_str.encode("utf-8"))
+    return ET.fromstring(xml_str)
 
 
-def test_compile_minimal_xml_roundtrip(tmp_path: Path):
+@pytest.fixture(scope="module")
+def minimal_xml_root():
+    """Compile the canonical minimal model once and share the parsed tree.
+
+    The assertions below only read from the tree, so one compile serves all
+    of them; ad-hoc inputs elsewhere in the module keep their direct calls.
+    """
     defaults = BIUNetworkDefaults(VTh=0.9, refractory=14, DSBitWidth=8, DSClockMHz=50)
     layers = [Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[7.0]]))]
 
     xml_str, sup = compile_model(defaults, layers)
     assert sup is None
-    # Parse to ensure well-formed and expected root/attrs
-    root = ET.fromstring(xml_str)
-    assert root.tag == "NetworkConfig"
-    assert root.attrib.get("type") == "BIUNetwork"
-    biu = root.find("BIUNetwork")
-    assert biu is not None
-    assert biu.findtext("VTh") == "0.9"
-    assert biu.findtext("refractory") == "14"
-    assert biu.findtext("DSBitWidth") == "8"
-    assert biu.findtext("DSClockMHz") == "50"
-    # DSMode defaults to ThresholdMode if missing
-    assert biu.findtext("DSMode") == "ThresholdMode"
-    arch = root.find("Architecture")
+    return _parse_xml(xml_str)
+
+
+def test_compile_minimal_xml_structure(minimal_xml_root):
+    assert minimal_xml_root.tag == "NetworkConfig"
+    assert minimal_xml_root.attrib.get("type") == "BIUNetwork"
+    assert minimal_xml_root.find("BIUNetwork") is not None
+    arch = minimal_xml_root.find("Architecture")
     assert arch is not None and arch.find("Layer") is not None
 
 
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        ("VTh", "0.9"),
+        ("refractory", "14"),
+        ("DSBitWidth", "8"),
+        ("DSClockMHz", "50"),
+        # DSMode defaults to ThresholdMode if missing
+        ("DSMode", "ThresholdMode"),
+    ],
+)
+def test_compile_minimal_defaults_emitted(minimal_xml_root, field: str, expected: str):
+    assert minimal_xml_root.findtext(f"BIUNetwork/{field}") == expected
+
+
 def test_precedence_and_validation(tmp_path: Path):
     defaults = BIUNetworkDefaults(VTh=0.6, RLeak=500e6, refractory=12, DSBitWidth=4, DSClockMHz=10)
     layer = Layer(
@@ -41,7 +72,7 @@ def test_precedence_and_validation(tmp_path: Path):
     )
 
     xml_str, _ = compile_model(defaults, [layer])
-    root = ET.fromstring(xml_str)
+    root = _parse_xml(xml_str)
     lyr = root.find("Architecture/Layer")
     assert lyr is not None
     # Ensure rows emitted and counts match
@@ -177,3 +208,20 @@ def test_write_input_data_supports_bytes(tmp_path: Path):
         "9",
     ]
 
+
+
+def test_quantize_weights_symmetric_scaling():
+    weights = [[1.0, -2.0], [4.0, 0.0]]
+    quantized, scale = quantize_weights(weights, bits=8)
+    assert quantized == [[32, -64], [127, 0]]
+    assert scale == 4.0 / 127
+    # Round-trip stays within one quantization step
+    for q_row, row in zip(quantized, weights):
+        for q, v in zip(q_row, row):
+            assert abs(q * scale - v) <= scale
+
+
+def test_quantize_weights_all_zero():
+    quantized, scale = quantize_weights([[0.0, 0.0]], bits=4)
+    assert quantized == [[0, 0]]
+    assert scale == 1.0
@@ -1,42 +1,78 @@
+"""Integration tests that drive the real NEMOSIM binary.
+
+Each test writes its artifacts under its own tmp_path, so the runs are
+independent; with pytest-xdist installed (`pytest -n 2`) the distinct
+xdist_group marks let the two simulator runs overlap on separate workers.
+"""
 from __future__ import annotations
 
 from pathlib import Path
 
 import pytest
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - numpy is optional
+    np = None
+
 from nemosdk.compiler import compile
 from nemosdk.model import BIUNetworkDefaults, Layer, Synapses
 from nemosdk.runner import NemoSimRunner
 
 
-ROOT = Path(__file__).resolve().parents[2]
+from _paths import repo_root
+
+ROOT = repo_root()
 SIM_WORKDIR = ROOT / "bin" / "Linux"
 SIM_BINARY = SIM_WORKDIR / "NEMOSIM"
 
 
+# One stat at import, shared by every test in this module (and every xdist
+# worker importing it); is_file() also rejects a directory at that path.
+_HAS_SIM = SIM_BINARY.is_file()
+
 requires_simulator = pytest.mark.skipif(
-    not SIM_BINARY.exists(),
+    not _HAS_SIM,
     reason="NemoSim binary not found; ensure bin/Linux/NEMOSIM is available for integration tests.",
 )
 
 
-def _assert_any_spike(spikes: list[int]) -> None:
-    assert spikes, "Expected spike data."
-    assert any(value != 0 for value in spikes), "Expected at least one spike event."
+@pytest.fixture(scope="module")
+def runner() -> NemoSimRunner:
+    """One runner for the whole module; its path validation runs once."""
+    return NemoSimRunner(working_dir=SIM_WORKDIR)
 
 
-@requires_simulator
-def test_build_with_probes_like_example_generates_probe_data(tmp_path: Path) -> None:
-    out_dir = tmp_path / "with_probes"
-
-    defaults = BIUNetworkDefaults(
-        VTh=0.6,
+def _make_defaults(vth: float) -> BIUNetworkDefaults:
+    """Shared network defaults; only the threshold differs between tests."""
+    return BIUNetworkDefaults(
+        VTh=vth,
         RLeak=500e6,
         refractory=12,
         DSBitWidth=4,
         DSClockMHz=10,
     )
 
+
+def _assert_any_spike(spikes) -> None:
+    if np is not None:
+        arr = np.asarray(spikes)
+        assert arr.size, "Expected spike data."
+        assert arr.any(), "Expected at least one spike event."
+        return
+    assert spikes, "Expected spike data."
+    assert any(value != 0 for value in spikes), "Expected at least one spike event."
+
+
+@requires_simulator
+@pytest.mark.xdist_group("nemosim_probes")
+def test_build_with_probes_like_example_generates_probe_data(
+    tmp_path: Path, runner: NemoSimRunner
+) -> None:
+    out_dir = tmp_path / "with_probes"
+
+    defaults = _make_defaults(0.6)
+
     layer0 = Layer(
         size=3,
         synapses=Synapses(
@@ -78,7 +114,6 @@ def test_build_with_probes_like_example_generates_probe_data(tmp_path: Path) ->
         data_input_file=data_input_file,
     )
 
-    runner = NemoSimRunner(working_dir=SIM_WORKDIR)
     result = runner.run(compiled_model, check=True)
     assert result.returncode == 0
 
@@ -93,16 +128,13 @@ def test_build_with_probes_like_example_generates_probe_data(tmp_path: Path) ->
 
 
 @requires_simulator
-def test_build_with_inline_input_like_example_spikes(tmp_path: Path) -> None:
+@pytest.mark.xdist_group("nemosim_inline_input")
+def test_build_with_inline_input_like_example_spikes(
+    tmp_path: Path, runner: NemoSimRunner
+) -> None:
     out_dir = tmp_path / "with_inline_input"
 
-    defaults = BIUNetworkDefaults(
-        VTh=0.05,
-        RLeak=500e6,
-        refractory=12,
-        DSBitWidth=4,
-        DSClockMHz=10,
-    )
+    defaults = _make_defaults(0.05)
 
     layer0 = Layer(
         size=5,
@@ -126,12 +158,16 @@ def test_build_with_inline_input_like_example_spikes(tmp_path: Path) -> None:
     )
 
     samples = [
-        (1, 6, 6, 1, 6),
-        (6, 1, 12, 11, 6),
-        (1, 0, 11, 6, 5),
-        (0, 11, 10, 5, 0),
-        (6, 5, 0, 0, 0),
+        [1, 6, 6, 1, 6],
+        [6, 1, 12, 11, 6],
+        [1, 0, 11, 6, 5],
+        [0, 11, 10, 5, 0],
+        [6, 5, 0, 0, 0],
     ]
+    if np is not None:
+        # One contiguous buffer; write_input_data then emits it via savetxt
+        # instead of a Python formatting loop.
+        samples = np.array(samples, dtype=np.int8)
 
     compiled_model = compile(
         defaults=defaults,
@@ -141,13 +177,17 @@ def test_build_with_inline_input_like_example_spikes(tmp_path: Path) -> None:
         input_data=samples,
     )
 
-    runner = NemoSimRunner(working_dir=SIM_WORKDIR)
-    result = runner.run(compiled_model, check=True)
-    assert result.returncode == 0
+    proc = runner.spawn(compiled_model)
+    assert proc.wait() == 0
 
     input_probe = compiled_model.get_probe("inputs")
-    spike_totals = [sum(input_probe.get_spikes(idx)) for idx in input_probe.list_neuron_indices()]
-    assert any(total > 0 for total in spike_totals), "Expected at least one active input neuron."
+    all_spikes = input_probe.get_all_spikes()
+    if np is not None:
+        arr = np.array(list(all_spikes.values()), dtype=np.int8)
+        active = (arr.sum(axis=1) > 0).any()
+    else:
+        active = any(sum(spikes) > 0 for spikes in all_spikes.values())
+    assert active, "Expected at least one active input neuron."
 
     output_probe = compiled_model.get_probe("output")
     _assert_any_spike(output_probe.get_spikes(0))
@@ -3,15 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 import re
 
+from _paths import repo_root
 
-ROOT = Path(__file__).resolve().parents[2]
+
+ROOT = repo_root()
+
+_README_RE = re.compile(rb'^readme\s*=\s*"([^"]+)"', re.MULTILINE)
 
 
 def test_pyproject_readme_file_exists() -> None:
     """Ensure the readme referenced in pyproject.toml exists on disk."""
     pyproject = ROOT / "pyproject.toml"
-    text = pyproject.read_text(encoding="utf-8")
-    match = re.search(r'^readme\s*=\s*"([^"]+)"', text, flags=re.MULTILINE)
+    match = _README_RE.search(pyproject.read_bytes())
     assert match, "readme field not found in pyproject.toml"
-    readme_path = pyproject.parent / match.group(1)
+    readme_path = pyproject.parent / match.group(1).decode("utf-8")
     assert readme_path.exists(), f"Referenced readme does not exist: {readme_path}"
@@ -6,7 +6,9 @@ that matches what's in the actual output files.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Final
 import json
+import os
 import sys
 import threading
 import time
@@ -14,11 +16,20 @@ import types
 
 import pytest
 
+try:  # numpy is optional for the SDK; used here as a fast reference reader
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised on numpy-less installs
+    np = None
+
 from nemosdk.model import BIUNetworkDefaults, Layer, Synapses
 from nemosdk.compiler import compile as compile_model, CompiledModel, LayerProbe
 from nemosdk.probe_utils import watch_probe
 
 
+# Constructed once: every compile in this module uses the stock defaults.
+_DEFAULTS: Final[BIUNetworkDefaults] = BIUNetworkDefaults()
+
+
 def _read_file_directly(output_dir: Path, file_type: str, layer_idx: int, neuron_idx: int) -> list[float | int]:
     """Read a data file directly from the output directory.
     
@@ -33,197 +44,157 @@ def _read_file_directly(output_dir: Path, file_type: str, layer_idx: int, neuron
     """
     filename = f"{file_type}_{layer_idx}_{neuron_idx}.txt"
     filepath = output_dir / filename
-    
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-    
-    with filepath.open() as f:
-        lines = [line.strip() for line in f if line.strip()]
-        if file_type == "spikes":
-            return [int(line) for line in lines]
-        else:
-            return [float(line) for line in lines]
 
+    # No exists() probe: let the open raise, so the hot path is one openat.
+    try:
+        raw = filepath.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}") from None
 
-def _compile_with_output(
-    tmp_path: Path,
-    layers: list[Layer],
-    *,
-    output_dir: Path,
-) -> CompiledModel:
-    """Compile layers with probes and rewrite config to point to `output_dir`."""
-    model_dir = tmp_path / "model"
-    model_dir.mkdir(exist_ok=True)
-    output_dir.mkdir(exist_ok=True, parents=True)
+    if np is not None:
+        # One C-level parse pass instead of a Python cast per line;
+        # fromstring's text mode skips loadtxt's per-row machinery entirely.
+        dtype = np.int64 if file_type == "spikes" else np.float64
+        return np.fromstring(raw, sep="\n", dtype=dtype).tolist()
+    # No TextIOWrapper: int()/float() parse bytes tokens directly.
+    caster = int if file_type == "spikes" else float
+    return [caster(line) for line in raw.splitlines() if line]
 
-    input_file = tmp_path / "input.txt"
-    input_file.write_text("0\n")
 
-    defaults = BIUNetworkDefaults()
-    compiled = compile_model(
-        defaults=defaults,
-        layers=layers,
-        out_dir=model_dir,
-        data_input_file=input_file,
-    )
+def _setup_output(tmp_path: Path, name: str = "output") -> Path:
+    """Create this test's output directory with one syscall and return it."""
+    output_dir = tmp_path / name
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
 
-    config_path = compiled.get_config_path()
-    with config_path.open() as f:
-        cfg = json.load(f)
-    cfg["output_directory"] = str(output_dir.resolve())
-    with config_path.open("w") as f:
-        json.dump(cfg, f, indent=2)
 
-    return CompiledModel(config_path=config_path)
+def _format_column(values: list[int | float]) -> bytes:
+    """One value per line: a single %-expansion, no generator."""
+    return (("%s\n" * len(values)) % tuple(values)).encode()
 
 
-def test_probe_spikes_matches_file(tmp_path: Path):
-    """Test that probe.get_spikes() returns data matching the file."""
-    # Create test output files first
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    
-    # Create spike files for layer 0, neurons 0-2
-    test_spikes = {
-        (0, 0): [0, 1, 0, 0, 1, 0, 1, 0, 0, 0],
-        (0, 1): [1, 0, 1, 0, 0, 1, 0, 0, 1, 0],
-        (0, 2): [0, 0, 0, 1, 0, 0, 0, 1, 0, 1],
-    }
-    
-    for (layer, neuron), spikes in test_spikes.items():
-        spike_file = output_dir / f"spikes_{layer}_{neuron}.txt"
-        spike_file.write_text("\n".join(str(s) for s in spikes) + "\n")
-    
-    # Create model with probe
-    layer0 = Layer(
-        size=3,
-        synapses=Synapses(rows=3, cols=2, weights=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]),
-        probe="test_layer",
-    )
+def _write_column(path: Path, values: list[int | float]) -> None:
+    _materialize_fixtures({path: _format_column(values)})
 
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0],
-        output_dir=output_dir,
-    )
 
-    probe = compiled.get_probe("test_layer")
-    
-    # Compare probe output with direct file reads
-    for neuron_idx in [0, 1, 2]:
-        probe_data = probe.get_spikes(neuron_idx)
-        file_data = _read_file_directly(output_dir, "spikes", 0, neuron_idx)
-        
-        assert probe_data == file_data, (
-            f"Mismatch for neuron {neuron_idx}: "
-            f"probe={probe_data}, file={file_data}"
-        )
-        assert probe_data == test_spikes[(0, neuron_idx)], (
-            f"Probe data doesn't match expected: {probe_data} != {test_spikes[(0, neuron_idx)]}"
-        )
+def _materialize_fixtures(mapping: dict[Path, bytes]) -> None:
+    """Write prebuilt payloads through raw fds: one open/write/close per file.
 
+    Tests build the whole path→payload mapping first, then push it out in one
+    tight loop, instead of interleaving formatting with buffered-IO writes.
+    """
+    for path, payload in mapping.items():
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
-def test_probe_vin_matches_file(tmp_path: Path):
-    """Test that probe.get_vin() returns data matching the file."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    
-    # Create vin files for layer 1, neurons 0-2
-    test_vin = {
-        (1, 0): [0.1, 0.2, 0.3, 0.4, 0.5],
-        (1, 1): [0.6, 0.7, 0.8, 0.9, 1.0],
-        (1, 2): [1.1, 1.2, 1.3, 1.4, 1.5],
-    }
-    
-    for (layer, neuron), values in test_vin.items():
-        vin_file = output_dir / f"vin_{layer}_{neuron}.txt"
-        vin_file.write_text("\n".join(str(v) for v in values) + "\n")
-    
-    # Create model with probe for layer 1
-    layer0 = Layer(
-        size=2,
-        synapses=Synapses(rows=2, cols=1, weights=[[1.0], [2.0]]),
-    )
-    layer1 = Layer(
-        size=3,
-        synapses=Synapses(rows=3, cols=2, weights=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]),
-        probe="output_layer",
-    )
-    
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0, layer1],
-        output_dir=output_dir,
-    )
 
-    probe = compiled.get_probe("output_layer")
-    
-    # Compare probe output with direct file reads
-    for neuron_idx in [0, 1, 2]:
-        probe_data = probe.get_vin(neuron_idx)
-        file_data = _read_file_directly(output_dir, "vin", 1, neuron_idx)
-        
-        assert len(probe_data) == len(file_data), (
-            f"Length mismatch for neuron {neuron_idx}: "
-            f"probe={len(probe_data)}, file={len(file_data)}"
-        )
-        assert probe_data == file_data, (
-            f"Mismatch for neuron {neuron_idx}: "
-            f"probe={probe_data}, file={file_data}"
-        )
-        assert probe_data == test_vin[(1, neuron_idx)], (
-            f"Probe data doesn't match expected: {probe_data} != {test_vin[(1, neuron_idx)]}"
-        )
+@pytest.fixture
+def compile_with_output(compiled_model_factory, tmp_path: Path):
+    """Per-test view of the session compile cache (see conftest.py).
 
+    Each call writes this test's config copy under its own tmp_path, so
+    CompiledModel instances never share mutable state across tests.
+    """
 
-def test_probe_vns_matches_file(tmp_path: Path):
-    """Test that probe.get_vns() returns data matching the file."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    
-    # Create vns files
-    test_vns = {
-        (0, 0): [0.5, 0.6, 0.7, 0.8, 0.9],
-        (0, 1): [1.0, 1.1, 1.2, 1.3, 1.4],
-    }
-    
-    for (layer, neuron), values in test_vns.items():
-        vns_file = output_dir / f"vns_{layer}_{neuron}.txt"
-        vns_file.write_text("\n".join(str(v) for v in values) + "\n")
-    
-    # Create model with probe
-    layer0 = Layer(
-        size=2,
-        synapses=Synapses(rows=2, cols=1, weights=[[1.0], [2.0]]),
-        probe="input_layer",
-    )
-    
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0],
-        output_dir=output_dir,
+    def _compile(layers: list[Layer], *, output_dir: Path) -> CompiledModel:
+        return compiled_model_factory(layers, output_dir=output_dir, config_dir=tmp_path)
+
+    return _compile
+
+
+@pytest.mark.parametrize(
+    "file_type, getter_name, probe_name, layer_idx, test_data",
+    [
+        (
+            "spikes",
+            "get_spikes",
+            "test_layer",
+            0,
+            {
+                (0, 0): [0, 1, 0, 0, 1, 0, 1, 0, 0, 0],
+                (0, 1): [1, 0, 1, 0, 0, 1, 0, 0, 1, 0],
+                (0, 2): [0, 0, 0, 1, 0, 0, 0, 1, 0, 1],
+            },
+        ),
+        (
+            "vin",
+            "get_vin",
+            "output_layer",
+            1,
+            {
+                (1, 0): [0.1, 0.2, 0.3, 0.4, 0.5],
+                (1, 1): [0.6, 0.7, 0.8, 0.9, 1.0],
+                (1, 2): [1.1, 1.2, 1.3, 1.4, 1.5],
+            },
+        ),
+        (
+            "vns",
+            "get_vns",
+            "input_layer",
+            0,
+            {
+                (0, 0): [0.5, 0.6, 0.7, 0.8, 0.9],
+                (0, 1): [1.0, 1.1, 1.2, 1.3, 1.4],
+            },
+        ),
+    ],
+)
+def test_probe_signal_matches_file(
+    tmp_path: Path,
+    compile_with_output,
+    file_type: str,
+    getter_name: str,
+    probe_name: str,
+    layer_idx: int,
+    test_data: dict[tuple[int, int], list[int | float]],
+):
+    """Each probe getter returns data matching the underlying file."""
+    output_dir = _setup_output(tmp_path)
+
+    _materialize_fixtures(
+        {
+            output_dir / f"{file_type}_{layer}_{neuron}.txt": _format_column(values)
+            for (layer, neuron), values in test_data.items()
+        }
     )
 
-    probe = compiled.get_probe("input_layer")
-    
-    # Compare probe output with direct file reads
-    for neuron_idx in [0, 1]:
-        probe_data = probe.get_vns(neuron_idx)
-        file_data = _read_file_directly(output_dir, "vns", 0, neuron_idx)
-        
-        assert probe_data == file_data, (
-            f"Mismatch for neuron {neuron_idx}: "
-            f"probe={probe_data}, file={file_data}"
-        )
-        assert probe_data == test_vns[(0, neuron_idx)], (
-            f"Probe data doesn't match expected: {probe_data} != {test_vns[(0, neuron_idx)]}"
-        )
+    # The probed layer's size matches the number of neurons in test_data;
+    # the vin case probes the second layer of a two-layer stack.
+    size = len(test_data)
+    probed = Layer(
+        size=size,
+        synapses=Synapses(rows=size, cols=1, weights=[[1.0]] * size),
+        probe=probe_name,
+    )
+    layers = [probed]
+    if layer_idx == 1:
+        layers.insert(0, Layer(size=2, synapses=Synapses(rows=2, cols=1, weights=[[1.0], [2.0]])))
+
+    compiled = compile_with_output(layers, output_dir=output_dir)
+    probe = compiled.get_probe(probe_name)
+    getter = getattr(probe, getter_name)
+
+    # Compare probe output with direct file reads; with numpy the comparison
+    # is one vectorized pass instead of element-wise list equality.
+    for neuron_idx in range(size):
+        probe_data = getter(neuron_idx)
+        file_data = _read_file_directly(output_dir, file_type, layer_idx, neuron_idx)
+
+        if np is not None:
+            arr = np.asarray(probe_data)
+            assert np.array_equal(arr, np.asarray(file_data))
+            assert np.array_equal(arr, np.asarray(test_data[(layer_idx, neuron_idx)]))
+        else:
+            assert probe_data == file_data
+            assert probe_data == test_data[(layer_idx, neuron_idx)]
 
 
-def test_probe_get_all_matches_files(tmp_path: Path):
+def test_probe_get_all_matches_files(tmp_path: Path, compile_with_output):
     """Test that get_all_* methods return data matching all files."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+    output_dir = _setup_output(tmp_path)
     
     # Create multiple files for layer 0
     test_data = {
@@ -232,10 +203,13 @@ def test_probe_get_all_matches_files(tmp_path: Path):
         "vns": {(0, 0): [1.0, 1.1, 1.2], (0, 1): [1.3, 1.4, 1.5], (0, 2): [1.6, 1.7, 1.8]},
     }
     
-    for file_type, data_dict in test_data.items():
-        for (layer, neuron), values in data_dict.items():
-            filepath = output_dir / f"{file_type}_{layer}_{neuron}.txt"
-            filepath.write_text("\n".join(str(v) for v in values) + "\n")
+    _materialize_fixtures(
+        {
+            output_dir / f"{file_type}_{layer}_{neuron}.txt": _format_column(values)
+            for file_type, data_dict in test_data.items()
+            for (layer, neuron), values in data_dict.items()
+        }
+    )
     
     # Create model with probe
     layer0 = Layer(
@@ -244,40 +218,35 @@ def test_probe_get_all_matches_files(tmp_path: Path):
         probe="test_layer",
     )
     
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0],
-        output_dir=output_dir,
-    )
+    compiled = compile_with_output([layer0], output_dir=output_dir)
 
     probe = compiled.get_probe("test_layer")
     
     # Test get_all_spikes
     all_spikes = probe.get_all_spikes()
-    assert len(all_spikes) == 3, f"Expected 3 neurons, got {len(all_spikes)}"
+    assert len(all_spikes) == 3
     for neuron_idx in [0, 1, 2]:
-        assert neuron_idx in all_spikes, f"Neuron {neuron_idx} missing from all_spikes"
+        assert neuron_idx in all_spikes
         assert all_spikes[neuron_idx] == test_data["spikes"][(0, neuron_idx)]
     
     # Test get_all_vin
     all_vin = probe.get_all_vin()
-    assert len(all_vin) == 3, f"Expected 3 neurons, got {len(all_vin)}"
+    assert len(all_vin) == 3
     for neuron_idx in [0, 1, 2]:
-        assert neuron_idx in all_vin, f"Neuron {neuron_idx} missing from all_vin"
+        assert neuron_idx in all_vin
         assert all_vin[neuron_idx] == test_data["vin"][(0, neuron_idx)]
     
     # Test get_all_vns
     all_vns = probe.get_all_vns()
-    assert len(all_vns) == 3, f"Expected 3 neurons, got {len(all_vns)}"
+    assert len(all_vns) == 3
     for neuron_idx in [0, 1, 2]:
-        assert neuron_idx in all_vns, f"Neuron {neuron_idx} missing from all_vns"
+        assert neuron_idx in all_vns
         assert all_vns[neuron_idx] == test_data["vns"][(0, neuron_idx)]
 
 
-def test_probe_missing_file_raises_error(tmp_path: Path):
+def test_probe_missing_file_raises_error(tmp_path: Path, compile_with_output):
     """Test that probe methods raise FileNotFoundError for missing files."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+    output_dir = _setup_output(tmp_path)
     
     # Create model with probe
     layer0 = Layer(
@@ -286,38 +255,22 @@ def test_probe_missing_file_raises_error(tmp_path: Path):
         probe="test_layer",
     )
     
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0],
-        output_dir=output_dir,
-    )
+    compiled = compile_with_output([layer0], output_dir=output_dir)
 
     probe = compiled.get_probe("test_layer")
     
     # Test that missing files raise FileNotFoundError
-    try:
+    with pytest.raises(FileNotFoundError):
         probe.get_spikes(0)
-        assert False, "Expected FileNotFoundError for missing spikes file"
-    except FileNotFoundError:
-        pass
-    
-    try:
+    with pytest.raises(FileNotFoundError):
         probe.get_vin(0)
-        assert False, "Expected FileNotFoundError for missing vin file"
-    except FileNotFoundError:
-        pass
-    
-    try:
+    with pytest.raises(FileNotFoundError):
         probe.get_vns(0)
-        assert False, "Expected FileNotFoundError for missing vns file"
-    except FileNotFoundError:
-        pass
 
 
-def test_probe_invalid_name_raises_keyerror(tmp_path: Path):
+def test_probe_invalid_name_raises_keyerror(tmp_path: Path, compile_with_output):
     """Test that get_probe() raises KeyError for invalid probe names."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+    output_dir = _setup_output(tmp_path)
     
     # Create model with probe
     layer0 = Layer(
@@ -326,24 +279,22 @@ def test_probe_invalid_name_raises_keyerror(tmp_path: Path):
         probe="valid_probe",
     )
     
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0],
-        output_dir=output_dir,
-    )
+    compiled = compile_with_output([layer0], output_dir=output_dir)
 
-    # Test that invalid probe name raises KeyError
-    try:
+    # Test that invalid probe name raises KeyError; the message should name
+    # both the missing probe and the available ones.
+    with pytest.raises(KeyError, match="(?s)invalid_probe.*valid_probe"):
         compiled.get_probe("invalid_probe")
-        assert False, "Expected KeyError for invalid probe name"
-    except KeyError as e:
-        assert "invalid_probe" in str(e)
-        assert "valid_probe" in str(e)  # Should list available probes
 
 
-def test_probe_list_probes(tmp_path: Path):
-    """Test that list_probes() returns all available probe names."""
-    # Create model with multiple probes
+@pytest.fixture(scope="session")
+def multi_probe_compiled(tmp_path_factory: pytest.TempPathFactory) -> CompiledModel:
+    """A model with two probed layers and one unprobed, compiled once per session.
+
+    Only metadata-level tests should use this; it never runs the simulator,
+    so its output directory stays empty.
+    """
+    base = tmp_path_factory.mktemp("multi_probe")
     layer0 = Layer(
         size=1,
         synapses=Synapses(rows=1, cols=1, weights=[[1.0]]),
@@ -359,52 +310,54 @@ def test_probe_list_probes(tmp_path: Path):
         synapses=Synapses(rows=1, cols=1, weights=[[1.0]]),
         # No probe for this layer
     )
-    
-    compiled = _compile_with_output(
-        tmp_path,
-        [layer0, layer1, layer2],
-        output_dir=tmp_path / "output_list",
+    input_file = base / "input.txt"
+    input_file.write_text("0\n")
+    return compile_model(
+        defaults=_DEFAULTS,
+        layers=[layer0, layer1, layer2],
+        out_dir=base / "model",
+        data_input_file=input_file,
     )
 
-    probes = compiled.list_probes()
+
+def test_probe_list_probes(multi_probe_compiled: CompiledModel):
+    """Test that list_probes() returns all available probe names."""
+    probes = multi_probe_compiled.list_probes()
     assert "input" in probes
     assert "output" in probes
-    assert len(probes) == 2, f"Expected 2 probes, got {len(probes)}: {probes}"
+    assert len(probes) == 2
 
 
-def test_probe_to_dataframe_with_stub_pandas(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+@pytest.fixture
+def fake_pandas(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Install a stub pandas module; monkeypatch restores sys.modules on teardown."""
+    mod = types.ModuleType("pandas")
+    mod.DataFrame = lambda data: {"data": data}  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pandas", mod)
+    return mod
+
+
+def test_probe_to_dataframe_with_stub_pandas(tmp_path: Path, compile_with_output, fake_pandas):
+    output_dir = _setup_output(tmp_path)
 
     spikes = [0, 1, 0, 1]
     vin = [0.1, 0.2, 0.3, 0.4]
-    (output_dir / "spikes_0_0.txt").write_text("\n".join(str(v) for v in spikes) + "\n")
-    (output_dir / "vin_0_0.txt").write_text("\n".join(str(v) for v in vin) + "\n")
+    _write_column(output_dir / "spikes_0_0.txt", spikes)
+    _write_column(output_dir / "vin_0_0.txt", vin)
 
     layer = Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[1.0]]), probe="probe0")
-    compiled = _compile_with_output(tmp_path, [layer], output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe0")
 
-    fake_pd = types.ModuleType("pandas")
-    fake_pd.DataFrame = lambda data: {"data": data}  # type: ignore[assignment]
-    original_pandas = sys.modules.get("pandas")
-    sys.modules["pandas"] = fake_pd
-    try:
-        df = probe.to_dataframe(neurons=[0], signals=("spikes", "vin"), sample_every=1)
-        assert df == {"data": {"spikes_n0": spikes, "vin_n0": vin}}
+    df = probe.to_dataframe(neurons=[0], signals=("spikes", "vin"), sample_every=1)
+    assert df == {"data": {"spikes_n0": spikes, "vin_n0": vin}}
 
-        downsampled = probe.to_dataframe(neurons=[0], signals=("spikes",), sample_every=2, max_rows=2)
-        assert downsampled == {"data": {"spikes_n0": [0, 0]}}
-    finally:
-        if original_pandas is not None:
-            sys.modules["pandas"] = original_pandas
-        else:
-            sys.modules.pop("pandas", None)
+    downsampled = probe.to_dataframe(neurons=[0], signals=("spikes",), sample_every=2, max_rows=2)
+    assert downsampled == {"data": {"spikes_n0": [0, 0]}}
 
 
 def test_watch_probe_waits_for_file(tmp_path: Path):
-    output_dir = tmp_path / "output_wait"
-    output_dir.mkdir()
+    output_dir = _setup_output(tmp_path, "output_wait")
     probe = LayerProbe(layer_idx=0, output_dir=output_dir)
     target = output_dir / "spikes_0_0.txt"
 
@@ -432,8 +385,7 @@ def test_watch_probe_waits_for_file(tmp_path: Path):
 
 
 def test_watch_probe_wait_timeout(tmp_path: Path):
-    output_dir = tmp_path / "output_wait_timeout"
-    output_dir.mkdir()
+    output_dir = _setup_output(tmp_path, "output_wait_timeout")
     probe = LayerProbe(layer_idx=0, output_dir=output_dir)
 
     iterator = watch_probe(
@@ -449,32 +401,36 @@ def test_watch_probe_wait_timeout(tmp_path: Path):
         next(iterator)
 
 
-def test_probe_iter_spikes_chunks(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+def test_probe_iter_spikes_chunks(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     values = [0, 1, 0, 0, 1, 0, 1, 0, 0, 0]
-    (output_dir / "spikes_0_0.txt").write_text("\n".join(str(v) for v in values) + "\n")
+    _write_column(output_dir / "spikes_0_0.txt", values)
 
     layer = Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
 
     chunks = list(probe.iter_spikes(0, chunk_size=4))
     assert chunks == [[0, 1, 0, 0], [1, 0, 1, 0], [0, 0]]
 
+    # A longer trace exercises the mmap tokenization across chunk boundaries.
+    long_values = ([0, 1] * 5000)[:9999]
+    _write_column(output_dir / "spikes_0_0.txt", long_values)
+    flat = [v for chunk in probe.iter_spikes(0, chunk_size=1024) for v in chunk]
+    assert flat == long_values
 
-def test_probe_iter_all_spikes(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+
+def test_probe_iter_all_spikes(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     data = {
         (0, 0): [0, 1, 0, 1, 0],
         (0, 1): [1, 0, 1, 0, 1],
     }
     for (layer_idx, neuron_idx), seq in data.items():
-        (output_dir / f"spikes_{layer_idx}_{neuron_idx}.txt").write_text("\n".join(str(v) for v in seq) + "\n")
+        _write_column(output_dir / f"spikes_{layer_idx}_{neuron_idx}.txt", seq)
 
     layer = Layer(size=2, synapses=Synapses(rows=2, cols=1, weights=[[1.0], [1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
 
     results = list(probe.iter_all_spikes(chunk_size=3))
@@ -487,18 +443,17 @@ def test_probe_iter_all_spikes(tmp_path: Path):
     assert results == expected
 
 
-def test_probe_stream_signal(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    (output_dir / "vin_0_0.txt").write_text("\n".join(str(v) for v in [0.1, 0.2, 0.3, 0.4]) + "\n")
-    (output_dir / "vin_0_1.txt").write_text("\n".join(str(v) for v in [1.1, 1.2, 1.3]) + "\n")
+def test_probe_stream_signal(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
+    _write_column(output_dir / "vin_0_0.txt", [0.1, 0.2, 0.3, 0.4])
+    _write_column(output_dir / "vin_0_1.txt", [1.1, 1.2, 1.3])
 
     layer = Layer(
         size=2,
         synapses=Synapses(rows=2, cols=1, weights=[[1.0], [1.0]]),
         probe="probe",
     )
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
 
     streamed = list(probe.stream("vin", chunk_size=2))
@@ -510,14 +465,13 @@ def test_probe_stream_signal(tmp_path: Path):
     ]
 
 
-def test_probe_summarize_signal(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+def test_probe_summarize_signal(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     spikes = [0, 1, 0, 1, 1]
-    (output_dir / "spikes_0_0.txt").write_text("\n".join(str(v) for v in spikes) + "\n")
+    _write_column(output_dir / "spikes_0_0.txt", spikes)
 
     layer = Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
 
     summary = probe.summarize("spikes")
@@ -530,25 +484,31 @@ def test_probe_summarize_signal(tmp_path: Path):
     assert stats["spikes"] == sum(spikes)
 
 
-def test_probe_list_neuron_indices(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+def test_probe_list_neuron_indices(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     for neuron_idx in range(3):
         (output_dir / f"spikes_0_{neuron_idx}.txt").write_text("0\n")
 
     layer = Layer(size=3, synapses=Synapses(rows=3, cols=1, weights=[[1.0], [1.0], [1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
     assert probe.list_neuron_indices() == [0, 1, 2]
 
+    # Without metadata the indices come from one directory scan; unrelated
+    # signals, other layers, and malformed names must be filtered out.
+    (output_dir / "vin_0_0.txt").write_text("0\n")
+    (output_dir / "spikes_1_5.txt").write_text("0\n")
+    (output_dir / "spikes_0_x.txt").write_text("0\n")
+    bare = LayerProbe(layer_idx=0, output_dir=output_dir)
+    assert bare.list_neuron_indices() == [0, 1, 2]
+
 
 def test_probes_json_written(tmp_path: Path):
-    defaults = BIUNetworkDefaults()
     layer = Layer(size=2, synapses=Synapses(rows=2, cols=1, weights=[[1.0], [1.0]]), probe="probe")
     input_file = tmp_path / "input.txt"
     input_file.write_text("0\n")
     compiled = compile_model(
-        defaults=defaults,
+        defaults=_DEFAULTS,
         layers=[layer],
         out_dir=tmp_path / "model",
         data_input_file=input_file,
@@ -561,10 +521,10 @@ def test_probes_json_written(tmp_path: Path):
     assert data["probes"][0]["layer_size"] == 2
 
 
-def test_compiled_model_reads_probe_metadata_from_disk(tmp_path: Path):
-    output_dir = tmp_path / "output"
+def test_compiled_model_reads_probe_metadata_from_disk(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     layer = Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer], output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
 
     fresh = CompiledModel(config_path=compiled.get_config_path())
     assert fresh.list_probes() == ["probe"]
@@ -573,14 +533,13 @@ def test_compiled_model_reads_probe_metadata_from_disk(tmp_path: Path):
     assert meta.layer_size == 1
 
 
-def test_watch_probe_follow(tmp_path: Path):
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
+def test_watch_probe_follow(tmp_path: Path, compile_with_output):
+    output_dir = _setup_output(tmp_path)
     file_path = output_dir / "spikes_0_0.txt"
     file_path.write_text("0\n")
 
     layer = Layer(size=1, synapses=Synapses(rows=1, cols=1, weights=[[1.0]]), probe="probe")
-    compiled = _compile_with_output(tmp_path, [layer],  output_dir=output_dir)
+    compiled = compile_with_output([layer], output_dir=output_dir)
     probe = compiled.get_probe("probe")
 
     def writer():
@@ -605,3 +564,26 @@ def test_watch_probe_follow(tmp_path: Path):
         thread.join()
 
     assert values == [0, 1, 2]
+
+
+def test_probe_consolidate_and_load_matrix(tmp_path: Path, compile_with_output):
+    np = pytest.importorskip("numpy")
+    output_dir = _setup_output(tmp_path)
+    data = {
+        (0, 0): [0, 1, 0, 1],
+        (0, 1): [1, 1, 0, 0],
+    }
+    for (layer_idx, neuron_idx), seq in data.items():
+        _write_column(output_dir / f"spikes_{layer_idx}_{neuron_idx}.txt", seq)
+
+    layer = Layer(size=2, synapses=Synapses(rows=2, cols=1, weights=[[1.0], [1.0]]), probe="probe")
+    compiled = compile_with_output([layer], output_dir=output_dir)
+    probe = compiled.get_probe("probe")
+
+    matrix = probe.load_signal_matrix("spikes")
+    assert matrix.shape == (2, 4)
+    assert matrix.tolist() == [data[(0, 0)], data[(0, 1)]]
+    assert (output_dir / "spikes_0.npy").exists()
+    # Second load memmaps the consolidated file
+    again = probe.load_signal_matrix("spikes")
+    assert np.array_equal(matrix, again)
@@ -3,13 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 import os
 
+import pytest
+
 from nemosdk.runner import NemoSimRunner
 from nemosdk.compiler import CompiledModel
 
 
 def _make_dummy_binary(dir_path: Path) -> Path:
     bin_path = dir_path / "NEMOSIM"
-    bin_path.write_text("#!/usr/bin/env bash\necho 'Finished executing.'\n", encoding="utf-8")
+    bin_path.write_text("#!/bin/sh\necho 'Finished executing.'\n", encoding="utf-8")
     os.chmod(bin_path, 0o755)
     return bin_path
 
@@ -17,7 +19,7 @@ def _make_dummy_binary(dir_path: Path) -> Path:
 def _make_custom_binary(dir_path: Path, name: str, script_body: str) -> Path:
     bin_path = dir_path / name
     bin_path.write_text(
-        "#!/usr/bin/env bash\nset -e\n"
+        "#!/bin/sh\nset -e\n"
         f"{script_body}\n",
         encoding="utf-8",
     )
@@ -25,6 +27,11 @@ def _make_custom_binary(dir_path: Path, name: str, script_body: str) -> Path:
     return bin_path
 
 
+def _read_log(path: Path) -> str:
+    """Slurp a log file in one read; no buffered line iteration."""
+    return path.read_bytes().decode("utf-8", errors="replace")
+
+
 def test_runner_success_captures_logs(tmp_path: Path):
     work = tmp_path / "Linux"
     work.mkdir(parents=True)
@@ -35,8 +42,8 @@ def test_runner_success_captures_logs(tmp_path: Path):
     runner = NemoSimRunner(working_dir=work)
     res = runner.run(CompiledModel(config_path=cfg), check=True)
     assert res.returncode == 0
-    assert res.stdout_path.exists()
-    assert res.stderr_path.exists()
+    assert "Finished executing." in _read_log(res.stdout_path)
+    assert _read_log(res.stderr_path) == ""
 
 
 def test_runner_missing_binary_error(tmp_path: Path):
@@ -46,63 +53,51 @@ def test_runner_missing_binary_error(tmp_path: Path):
     cfg.write_text("{}", encoding="utf-8")
 
     runner = NemoSimRunner(working_dir=work)
-    try:
+    with pytest.raises(FileNotFoundError):
         runner.run(CompiledModel(config_path=cfg))
-        assert False, "Expected FileNotFoundError"
-    except FileNotFoundError:
-        pass
 
 
-def test_runner_env_var_binary_path(tmp_path: Path):
+def test_runner_env_var_binary_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test that NEMOSIM_BINARY environment variable overrides default binary path."""
     work = tmp_path / "Linux"
     work.mkdir(parents=True)
     custom_bin_dir = tmp_path / "custom_bin"
     custom_bin_dir.mkdir(parents=True)
     custom_binary = custom_bin_dir / "CUSTOM_NEMOSIM"
-    custom_binary.write_text("#!/usr/bin/env bash\necho 'Finished executing.'\n", encoding="utf-8")
+    custom_binary.write_text("#!/bin/sh\necho 'Finished executing.'\n", encoding="utf-8")
     os.chmod(custom_binary, 0o755)
     
     cfg = tmp_path / "config.json"
     cfg.write_text("{}", encoding="utf-8")
 
-    # Set environment variable
-    os.environ["NEMOSIM_BINARY"] = str(custom_binary)
-    try:
-        runner = NemoSimRunner(working_dir=work)
-        assert runner.binary_path == custom_binary
-        res = runner.run(CompiledModel(config_path=cfg), check=True)
-        assert res.returncode == 0
-    finally:
-        # Clean up environment variable
-        os.environ.pop("NEMOSIM_BINARY", None)
+    # monkeypatch restores the environment on teardown (and is xdist-safe)
+    monkeypatch.setenv("NEMOSIM_BINARY", str(custom_binary))
+    runner = NemoSimRunner(working_dir=work)
+    assert runner.binary_path == custom_binary
+    res = runner.run(CompiledModel(config_path=cfg), check=True)
+    assert res.returncode == 0
 
 
-def test_runner_explicit_binary_overrides_env_var(tmp_path: Path):
+def test_runner_explicit_binary_overrides_env_var(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test that explicit binary_path parameter takes precedence over environment variable."""
     work = tmp_path / "Linux"
     work.mkdir(parents=True)
     explicit_binary = work / "EXPLICIT_NEMOSIM"
-    explicit_binary.write_text("#!/usr/bin/env bash\necho 'Finished executing.'\n", encoding="utf-8")
+    explicit_binary.write_text("#!/bin/sh\necho 'Finished executing.'\n", encoding="utf-8")
     os.chmod(explicit_binary, 0o755)
     
     env_binary = tmp_path / "env_binary"
-    env_binary.write_text("#!/usr/bin/env bash\necho 'Should not use this'\n", encoding="utf-8")
+    env_binary.write_text("#!/bin/sh\necho 'Should not use this'\n", encoding="utf-8")
     os.chmod(env_binary, 0o755)
     
     cfg = tmp_path / "config.json"
     cfg.write_text("{}", encoding="utf-8")
 
-    # Set environment variable
-    os.environ["NEMOSIM_BINARY"] = str(env_binary)
-    try:
-        runner = NemoSimRunner(working_dir=work, binary_path=explicit_binary)
-        assert runner.binary_path == explicit_binary
-        res = runner.run(CompiledModel(config_path=cfg), check=True)
-        assert res.returncode == 0
-    finally:
-        # Clean up environment variable
-        os.environ.pop("NEMOSIM_BINARY", None)
+    monkeypatch.setenv("NEMOSIM_BINARY", str(env_binary))
+    runner = NemoSimRunner(working_dir=work, binary_path=explicit_binary)
+    assert runner.binary_path == explicit_binary
+    res = runner.run(CompiledModel(config_path=cfg), check=True)
+    assert res.returncode == 0
 
 
 def test_runner_timeout(tmp_path: Path):
@@ -113,11 +108,8 @@ def test_runner_timeout(tmp_path: Path):
     cfg.write_text("{}", encoding="utf-8")
 
     runner = NemoSimRunner(working_dir=work)
-    try:
+    with pytest.raises(TimeoutError):
         runner.run(CompiledModel(config_path=cfg), timeout=0.1)
-        assert False, "Expected TimeoutError"
-    except TimeoutError:
-        pass
 
 
 def test_runner_stream_output(tmp_path: Path, capsys):
@@ -149,6 +141,9 @@ def test_runner_stream_output(tmp_path: Path, capsys):
     assert "stderr line" in captured.err
     assert any("stdout line" in line for line in stdout_lines)
     assert any("stderr line" in line for line in stderr_lines)
+    # Logs receive the same bytes that were streamed
+    assert "stdout line" in _read_log(res.stdout_path)
+    assert "stderr line" in _read_log(res.stderr_path)
 
 
 def test_runner_log_files_unique(tmp_path: Path):
@@ -11,36 +11,40 @@ from nemosdk.model import (
 from nemosdk.compiler import compile as compile_model
 
 
-def test_synapse_rows_cols_must_match():
+def _mismatched_synapse_rows() -> None:
     # rows=2 but only 1 row provided
     bad_syn = Synapses(rows=2, cols=1, weights=[[1.0]])
-    layer = Layer(size=2, synapses=bad_syn)
-    with pytest.raises(ValueError):
-        layer.validate()
+    Layer(size=2, synapses=bad_syn).validate()
 
 
-def test_layer_size_equals_synapse_rows():
+def _layer_size_synapse_rows_mismatch() -> None:
     defaults = BIUNetworkDefaults(DSBitWidth=4, DSClockMHz=1)
     syn = Synapses(rows=1, cols=1, weights=[[1.0]])
-    layer = Layer(size=2, synapses=syn)
-    with pytest.raises(ValueError):
-        compile_model(defaults, [layer])
+    compile_model(defaults, [Layer(size=2, synapses=syn)])
 
 
-def test_override_indices_out_of_bounds():
+def _override_index_out_of_bounds() -> None:
     syn = Synapses(rows=1, cols=1, weights=[[1.0]])
     # neuron index out of bounds
-    layer = Layer(size=1, synapses=syn, neurons=[NeuronOverride(index=3, VTh=0.2)])
-    with pytest.raises(ValueError):
-        layer.validate()
+    Layer(size=1, synapses=syn, neurons=[NeuronOverride(index=3, VTh=0.2)]).validate()
 
 
-def test_range_out_of_bounds():
+def _range_out_of_bounds() -> None:
     syn = Synapses(rows=2, cols=1, weights=[[1.0], [2.0]])
     # end >= size
-    layer = Layer(size=2, synapses=syn, ranges=[NeuronOverrideRange(start=0, end=2, VTh=0.2)])
+    Layer(size=2, synapses=syn, ranges=[NeuronOverrideRange(start=0, end=2, VTh=0.2)]).validate()
+
+
+@pytest.mark.parametrize(
+    "trigger",
+    [
+        _mismatched_synapse_rows,
+        _layer_size_synapse_rows_mismatch,
+        _override_index_out_of_bounds,
+        _range_out_of_bounds,
+    ],
+    ids=lambda fn: fn.__name__.lstrip("_"),
+)
+def test_invalid_model_raises_value_error(trigger) -> None:
     with pytest.raises(ValueError):
-        layer.validate()
-
-
-
+        trigger()
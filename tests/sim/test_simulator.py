@@ -1,4 +1,12 @@
+import collections
+import functools
+import hashlib
+import json
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+import re
+import shutil
 import subprocess
 import unittest
 from pathlib import Path
@@ -6,19 +14,26 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 SCRIPT = PROJECT_ROOT / "scripts" / "run_nemosim.sh"
+BIN_DIR = PROJECT_ROOT / "bin" / "Linux"
 
-# Root-level test data remains under tests/data
-ROOT_MULTI_DIR = PROJECT_ROOT / "tests" / "data" / "multi_layer_test"
-ROOT_MULTI_CONFIG = ROOT_MULTI_DIR / "config.json"
-ROOT_MULTI_OUTPUT = ROOT_MULTI_DIR / "output"
+# Opt-in cross-run cache: replaying recorded totals skips real simulator
+# coverage, so full-coverage CI paths leave NEMOSIM_CACHE unset.
+CACHE_ENABLED = os.environ.get("NEMOSIM_CACHE") == "1"
+SIMCACHE_MANIFEST = PROJECT_ROOT / "tests" / ".simcache" / "manifest.json"
+
+_TOTALS_RE = re.compile(rb"^Total (synaptic|neurons) energy:\s*(.+?)\s*$")
+_TOTAL_VALUE_RE = re.compile(r"^([0-9.eE+-]+)\s*fJ$")
 
-ROOT_PRECEDENCE_DIR = PROJECT_ROOT / "tests" / "data" / "per_neuron_precedence_test"
-ROOT_PRECEDENCE_CONFIG = ROOT_PRECEDENCE_DIR / "config.json"
-ROOT_PRECEDENCE_OUTPUT = ROOT_PRECEDENCE_DIR / "output"
 
-ROOT_ML_OVERRIDES_DIR = PROJECT_ROOT / "tests" / "data" / "multi_layer_overrides_test"
-ROOT_ML_OVERRIDES_CONFIG = ROOT_ML_OVERRIDES_DIR / "config.json"
-ROOT_ML_OVERRIDES_OUTPUT = ROOT_ML_OVERRIDES_DIR / "output"
+def parse_energy_fj(text: str) -> float:
+    """Numeric value of an 'X fJ' total; raises ValueError on malformed text."""
+    m = _TOTAL_VALUE_RE.match(text)
+    if m is None:
+        raise ValueError(f"Unparseable energy total: {text!r}")
+    return float(m.group(1))
+
+# Root-level test data remains under tests/data
+_DATA_DIR = PROJECT_ROOT / "tests" / "data"
 
 EXPECTED = {
     "root_multi": ("3.58167e+07 fJ", "4.00494e+08 fJ"),
@@ -27,74 +42,242 @@ EXPECTED = {
 }
 
 
+def _scenario(data_dir_name: str) -> tuple[list[str], Path]:
+    """Build `(args, output_dir)` for a tests/data scenario directory."""
+    d = _DATA_DIR / data_dir_name
+    return [str(SCRIPT), str(d / "config.json")], d / "output"
+
+
+# (args, output_dir) per scenario; shared by the tests and the prewarm below.
+SCENARIOS = {
+    "root_multi": _scenario("multi_layer_test"),
+    "root_precedence": _scenario("per_neuron_precedence_test"),
+    "root_ml_overrides": _scenario("multi_layer_overrides_test"),
+}
+
+
+_TAIL_LINES = 200
+
+
 def run_and_capture(args):
-    env = os.environ.copy()
-    proc = subprocess.run(
+    """Run the simulator, scanning stdout as it streams.
+
+    Only the energy totals, the finished marker, and a bounded tail for
+    error context are retained; verbose per-timestep output is discarded
+    on the fly instead of buffering the whole log.
+    """
+    # close_fds=False plus no cwd keeps CPython on its posix_spawn fast path
+    # (no fork + fd-closing sweep). Safe here: fds Python opens are
+    # non-inheritable (PEP 446), and the wrapper script resolves every path
+    # from its own location, so it does not care about our working directory.
+    proc = subprocess.Popen(
         args,
-        cwd=str(PROJECT_ROOT),
-        env=env,
+        close_fds=False,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        check=False,
     )
-    return proc.returncode, proc.stdout
+    totals = {}
+    finished = False
+    tail = collections.deque(maxlen=_TAIL_LINES)
+    for line in proc.stdout:
+        tail.append(line)
+        if line.startswith(b"Finished executing."):
+            finished = True
+            continue
+        m = _TOTALS_RE.match(line)
+        if m:
+            totals[m.group(1)] = m.group(2).decode()
+    code = proc.wait()
+    return code, totals, finished, b"".join(tail)
+
+
+@functools.lru_cache(maxsize=None)
+def run_scenario(args: tuple):
+    """Memoize simulator invocations per session.
+
+    The script and configs do not change while the suite runs, so identical
+    argument tuples (e.g. scenarios asserted from several angles) only cost
+    one simulator process.
+    """
+    return run_and_capture(list(args))
 
 
-def extract_totals(output: str):
-    total_syn = None
-    total_neu = None
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith("Total synaptic energy:"):
-            total_syn = line.split(":", 1)[1].strip()
-        elif line.startswith("Total neurons energy:"):
-            total_neu = line.split(":", 1)[1].strip()
-    return total_syn, total_neu
+def scenario_input_hash(config_path: Path) -> str:
+    """Digest every file the simulator reads for `config_path`.
+
+    Covers the wrapper script, the pinned binary, the config itself, and any
+    existing file the config references (relative paths resolve against
+    bin/Linux, the simulator's working directory). `output_directory` is
+    excluded: the simulator writes it, it does not read it.
+    """
+    inputs = [SCRIPT, BIN_DIR / "NEMOSIM", config_path]
+    for key, value in json.loads(config_path.read_bytes()).items():
+        if key == "output_directory" or not isinstance(value, str):
+            continue
+        p = Path(value)
+        if not p.is_absolute():
+            p = BIN_DIR / p
+        if p.is_file():
+            inputs.append(p)
+    h = hashlib.blake2b(digest_size=16)
+    for p in inputs:
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def manifest_load() -> dict:
+    try:
+        return json.loads(SIMCACHE_MANIFEST.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def manifest_store(expected_key: str, input_hash: str, totals: dict) -> None:
+    manifest = manifest_load()
+    manifest[expected_key] = {
+        "input_hash": input_hash,
+        "totals": {k.decode(): v for k, v in totals.items()},
+    }
+    SIMCACHE_MANIFEST.parent.mkdir(exist_ok=True)
+    # Per-pid temp name + atomic replace keeps concurrent xdist workers from
+    # tearing the file; a lost update just means one extra re-run next time.
+    tmp = SIMCACHE_MANIFEST.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    os.replace(tmp, SIMCACHE_MANIFEST)
+
+
+def reset_output(d: Path) -> None:
+    """Drop any stale output in two syscalls so sanity checks see fresh files."""
+    shutil.rmtree(d, ignore_errors=True)
+    d.mkdir(parents=True, exist_ok=True)
+
+
+_PREWARMED: set[tuple[str, ...]] = set()
+
+
+def prewarm_scenarios() -> None:
+    """Launch every scenario's simulator child concurrently and memoize results.
+
+    The subprocesses are the entire cost; threads suffice because each worker
+    just blocks on child I/O, so the serial suite collapses from the sum of
+    scenario runtimes to the longest one. Tests then read the lru_cached
+    results and must not reset output dirs the prewarmed runs populated.
+    """
+    futures = []
+    with ThreadPoolExecutor(max_workers=len(SCENARIOS)) as ex:
+        for args, output_dir in SCENARIOS.values():
+            reset_output(output_dir)
+            _PREWARMED.add(tuple(args))
+            futures.append(ex.submit(run_scenario, tuple(args)))
+        for fut in futures:
+            fut.result()
+
+
+def has_min_lines(path: Path, n: int) -> bool:
+    """True if `path` holds at least `n` newlines; stops reading once it does."""
+    count = 0
+    with path.open("rb") as fh:
+        while chunk := fh.read(65536):
+            count += chunk.count(b"\n")
+            if count >= n:
+                return True
+    return count >= n
 
 
 def assert_output_sanity(testcase: unittest.TestCase, output_dir: Path):
-    spikes = sorted(output_dir.glob("spikes_*.txt"))
-    vin = sorted(output_dir.glob("vin_*.txt"))
-    vns = sorted(output_dir.glob("vns_*.txt"))
+    # One scandir pass buckets all three signal families.
+    spikes: list[Path] = []
+    vin: list[Path] = []
+    vns: list[Path] = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".txt"):
+                continue
+            if name.startswith("spikes_"):
+                spikes.append(Path(entry.path))
+            elif name.startswith("vin_"):
+                vin.append(Path(entry.path))
+            elif name.startswith("vns_"):
+                vns.append(Path(entry.path))
+    spikes.sort()
+    vin.sort()
+    vns.sort()
     testcase.assertGreaterEqual(len(spikes), 1, f"No spikes_*.txt in {output_dir}")
     testcase.assertGreaterEqual(len(vin), 1, f"No vin_*.txt in {output_dir}")
     testcase.assertGreaterEqual(len(vns), 1, f"No vns_*.txt in {output_dir}")
     for f in [spikes[0], vin[0], vns[0]]:
         size = f.stat().st_size
         testcase.assertGreater(size, 0, f"Empty output file: {f}")
-        with f.open("r") as fh:
-            cnt = sum(1 for _ in fh)
-        testcase.assertGreaterEqual(cnt, 10, f"Too few lines in {f}: {cnt}")
+        testcase.assertTrue(has_min_lines(f, 10), f"Too few lines in {f}")
 
 
 class TestNemoSimRunner(unittest.TestCase):
-    def setUp(self):
-        self.assertTrue(SCRIPT.exists(), f"Missing script: {SCRIPT}")
-        self.assertTrue(os.access(SCRIPT, os.X_OK), f"Script not executable: {SCRIPT}")
+    @classmethod
+    def setUpClass(cls):
+        # Session invariants; checking them once per process is enough.
+        assert SCRIPT.exists(), f"Missing script: {SCRIPT}"
+        assert os.access(SCRIPT, os.X_OK), f"Script not executable: {SCRIPT}"
+        # Overlap the simulator children when this process will run every
+        # scenario itself and has the cores to do so. Under xdist each worker
+        # gets a subset, and under NEMOSIM_CACHE the manifest may make runs
+        # unnecessary.
+        if (
+            os.environ.get("PYTEST_XDIST_WORKER") is None
+            and not CACHE_ENABLED
+            and not _PREWARMED
+            and (os.cpu_count() or 1) > 1
+        ):
+            prewarm_scenarios()
+
+    def assert_energy_close(self, actual: str | None, expected: str, label: str, context: str = ""):
+        """Compare 'X fJ' totals numerically so formatting changes don't break pins."""
+        self.assertIsNotNone(actual, f"Missing {label}:\n{context}")
+        value = parse_energy_fj(actual)
+        pinned = parse_energy_fj(expected)
+        self.assertTrue(
+            math.isclose(value, pinned, rel_tol=1e-5),
+            f"{label}: got {actual!r}, pinned {expected!r}",
+        )
 
     def assert_run_ok_totals_pinned(self, args, expected_key: str, output_dir: Path | None = None):
-        code, out = run_and_capture(args)
-        self.assertEqual(code, 0, f"Non-zero exit ({code}) for {args}:\n{out}")
-        self.assertIn("Finished executing.", out)
-        total_syn, total_neu = extract_totals(out)
-        self.assertIsNotNone(total_syn, f"Missing synaptic energy in output:\n{out}")
-        self.assertIsNotNone(total_neu, f"Missing neurons energy in output:\n{out}")
         exp_syn, exp_neu = EXPECTED[expected_key]
-        self.assertEqual(total_syn, exp_syn, f"Synaptic energy mismatch for {expected_key}")
-        self.assertEqual(total_neu, exp_neu, f"Neurons energy mismatch for {expected_key}")
+        input_hash = None
+        if CACHE_ENABLED:
+            input_hash = scenario_input_hash(Path(args[1]))
+            entry = manifest_load().get(expected_key)
+            if entry is not None and entry.get("input_hash") == input_hash:
+                # Inputs unchanged since the recorded run; replay its totals.
+                # Output files were sanity-checked when the entry was stored.
+                cached = entry.get("totals", {})
+                self.assert_energy_close(cached.get("synaptic"), exp_syn, f"cached synaptic energy for {expected_key}")
+                self.assert_energy_close(cached.get("neurons"), exp_neu, f"cached neurons energy for {expected_key}")
+                return
+        if output_dir is not None and tuple(args) not in _PREWARMED:
+            reset_output(output_dir)
+        code, totals, finished, tail = run_scenario(tuple(args))
+        context = tail.decode("utf-8", errors="replace")
+        self.assertEqual(code, 0, f"Non-zero exit ({code}) for {args}:\n{context}")
+        self.assertTrue(finished, f"Missing 'Finished executing.' marker:\n{context}")
+        self.assert_energy_close(totals.get(b"synaptic"), exp_syn, f"synaptic energy for {expected_key}", context)
+        self.assert_energy_close(totals.get(b"neurons"), exp_neu, f"neurons energy for {expected_key}", context)
         if output_dir is not None:
             self.assertTrue(output_dir.exists(), f"Expected output dir not created: {output_dir}")
             assert_output_sanity(self, output_dir)
+        if input_hash is not None:
+            manifest_store(expected_key, input_hash, totals)
 
     def test_root_multilayer_scenario(self):
-        self.assert_run_ok_totals_pinned([str(SCRIPT), str(ROOT_MULTI_CONFIG)], "root_multi", ROOT_MULTI_OUTPUT)
+        args, output_dir = SCENARIOS["root_multi"]
+        self.assert_run_ok_totals_pinned(args, "root_multi", output_dir)
 
     def test_root_per_neuron_precedence_scenario(self):
-        self.assert_run_ok_totals_pinned([str(SCRIPT), str(ROOT_PRECEDENCE_CONFIG)], "root_precedence", ROOT_PRECEDENCE_OUTPUT)
+        args, output_dir = SCENARIOS["root_precedence"]
+        self.assert_run_ok_totals_pinned(args, "root_precedence", output_dir)
 
     def test_root_multilayer_overrides_scenario(self):
-        self.assert_run_ok_totals_pinned([str(SCRIPT), str(ROOT_ML_OVERRIDES_CONFIG)], "root_ml_overrides", ROOT_ML_OVERRIDES_OUTPUT)
+        args, output_dir = SCENARIOS["root_ml_overrides"]
+        self.assert_run_ok_totals_pinned(args, "root_ml_overrides", output_dir)
 
 
 if __name__ == "__main__":